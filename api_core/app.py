@@ -4,6 +4,7 @@ import asyncio
 import logging
 
 import httpx
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
@@ -18,7 +19,10 @@ from api_core.routes.market import router as market_router
 from api_core.routes.ops import router as ops_router
 from api_core.routes.search import router as search_router
 from api_core.routes.stocks import router as stocks_router
+from api_core.services.normalizers import df_to_json
 from api_core.services.observability import request_timing_middleware
+from api_core.services.providers import get_bist_index_provider, get_eurobond_provider, get_kap_provider, get_tcmb_rates_provider, market
+from api_core.services.response import FastJSONResponse
 from api_core.services.security import limiter
 
 
@@ -28,6 +32,7 @@ def create_app() -> FastAPI:
         title="BorsaPy Ultimate API",
         description="Professional Financial Gateway for Turkish Markets.",
         version="2.0.0",
+        default_response_class=FastJSONResponse,
     )
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
@@ -51,6 +56,16 @@ def create_app() -> FastAPI:
 
     @app.on_event("startup")
     async def startup_event():
+        # Sync endpoints block on upstream I/O in AnyIO's worker pool (40
+        # threads by default); widen it so slow providers don't queue requests.
+        to_thread.current_default_thread_limiter().total_tokens = settings.worker_threads
+
+        # Build the provider singletons (and their pooled HTTP clients) now
+        # rather than inside whichever request happens to touch them first.
+        get_kap_provider()
+        get_tcmb_rates_provider()
+        get_eurobond_provider()
+
         async def ping_regularly():
             if not settings.render_external_url:
                 return
@@ -62,6 +77,23 @@ def create_app() -> FastAPI:
                 except Exception:
                     pass
 
+        async def refresh_companies_regularly():
+            # /stocks/list pages are slices of this largely static table;
+            # keep its JSON rows in app state instead of rebuilding per page.
+            while True:
+                try:
+                    df = await asyncio.to_thread(market.companies)
+                    app.state.company_rows = df_to_json(df) if not df.empty else None
+                except Exception:
+                    pass
+                await asyncio.sleep(6 * 60 * 60)
+
         asyncio.create_task(ping_regularly())
+        asyncio.create_task(refresh_companies_regularly())
+
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        # Async clients are bound to this loop and must be closed on it
+        await get_bist_index_provider().aclose()
 
     return app
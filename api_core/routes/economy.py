@@ -1,6 +1,6 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
-from api_core.services.cache import get_cached_market, get_cached_static
+from api_core.services.cache import cache_response, get_cached_market, get_cached_static
 from api_core.services.normalizers import compact_payload, df_to_json
 from api_core.services.providers import EconomicCalendar, Inflation, TCMB, VIOP, tax
 
@@ -8,7 +8,8 @@ router = APIRouter(tags=["economy"])
 
 
 @router.get("/market/economy/rates")
-def get_tcmb_rates():
+@cache_response("static")
+def get_tcmb_rates(request: Request):
     def fetch():
         try:
             return [compact_payload(row) for row in df_to_json(TCMB().rates)]
@@ -18,8 +19,7 @@ def get_tcmb_rates():
     return get_cached_static("TCMB_RATES", fetch)
 
 
-@router.get("/market/economy/calendar")
-def get_economic_calendar(scope: str = "today"):
+def _economic_calendar_payload(scope: str = "today"):
     def fetch():
         cal = EconomicCalendar()
         if scope == "week":
@@ -33,8 +33,15 @@ def get_economic_calendar(scope: str = "today"):
     return get_cached_market(f"CALENDAR_{scope}", fetch)
 
 
+@router.get("/market/economy/calendar")
+@cache_response("market")
+def get_economic_calendar(request: Request, scope: str = "today"):
+    return _economic_calendar_payload(scope)
+
+
 @router.get("/viop/list")
-def viop_list(category: str = "all"):
+@cache_response("market")
+def viop_list(request: Request, category: str = "all"):
     def fetch():
         v = VIOP()
         if category == "stock":
@@ -45,7 +52,8 @@ def viop_list(category: str = "all"):
 
 
 @router.get("/market/economy/inflation")
-def inflation_data():
+@cache_response("static")
+def inflation_data(request: Request):
     def fetch():
         inf = Inflation()
         return compact_payload({"tufe": inf.latest("tufe"), "ufe": inf.latest("ufe")})
@@ -54,5 +62,6 @@ def inflation_data():
 
 
 @router.get("/market/tax")
-def tax_table():
+@cache_response("static")
+def tax_table(request: Request):
     return get_cached_static("TAX_TABLE", lambda: df_to_json(tax.withholding_tax_table()))
@@ -4,7 +4,7 @@ from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import APIRouter, Query, Request, Response
 
-from api_core.services.cache import get_cached_market, get_cached_realtime, get_cached_static
+from api_core.services.cache import cache_response, get_cached_market, get_cached_realtime, get_cached_static
 from api_core.services.normalizers import clean_json_val, compact_payload, df_to_json, normalize_fund_row, resolve_fund_risk
 from api_core.services.providers import Fund, Index, parse_fund_holdings_no_llm, screen_funds
 from api_core.services.response import api_ok, pagination_meta
@@ -65,6 +65,7 @@ def _list_funds_payload(fund_type: str = "YAT", limit: int = 50, offset: int = 0
 
 @router.get("/list")
 @limiter.limit("20/minute")
+@cache_response("static")
 def list_funds(request: Request, response: Response, fund_type: str = "YAT", limit: int = 50, offset: int = 0, envelope: bool = False):
     def fetch():
         return _list_funds_payload(fund_type=fund_type, limit=limit, offset=offset)
@@ -79,6 +80,7 @@ def list_funds(request: Request, response: Response, fund_type: str = "YAT", lim
 
 @router.get("/screener")
 @limiter.limit("20/minute")
+@cache_response("market")
 def tefas_screener(request: Request, response: Response, fund_type: str = "YAT", envelope: bool = False):
     def fetch():
         return [compact_payload(row) for row in df_to_json(screen_funds(fund_type=fund_type, limit=2000))]
@@ -90,6 +92,7 @@ def tefas_screener(request: Request, response: Response, fund_type: str = "YAT",
 
 @router.get("/{code}")
 @limiter.limit("30/minute")
+@cache_response("static")
 def get_fund_detail(request: Request, response: Response, code: str):
     code = code.upper()
 
@@ -117,6 +120,7 @@ def get_fund_detail(request: Request, response: Response, code: str):
 
 @router.get("/{code}/history")
 @limiter.limit("20/minute")
+@cache_response("realtime")
 def get_fund_history(request: Request, response: Response, code: str, period: str = "1mo"):
     code = code.upper()
 
@@ -135,6 +139,7 @@ def get_fund_history(request: Request, response: Response, code: str, period: st
 
 @router.get("/{code}/estimated-return")
 @limiter.limit("10/minute")
+@cache_response("realtime")
 def get_fund_estimated_return(request: Request, response: Response, code: str):
     code = code.upper()
 
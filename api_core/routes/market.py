@@ -1,15 +1,16 @@
 from __future__ import annotations
 
+import numpy as np
 from fastapi import APIRouter, Query, Request, Response
 
-from api_core.services.analytics import analyze_sentiment
-from api_core.services.cache import get_cached_market, get_cached_realtime
+from api_core.services.analytics import analyze_sentiment, last_rsi
+from api_core.services.cache import cache_response, get_cached_market, get_cached_realtime
 from api_core.services.normalizers import clean_json_val, df_to_json, normalize_fund_row, normalize_stock_row
 from api_core.services.providers import Fund, Ticker, technical
 from api_core.services.response import api_ok, pagination_meta
 from api_core.services.security import limiter
 from api_core.routes.funds import _list_funds_payload, list_funds
-from api_core.routes.economy import get_economic_calendar
+from api_core.routes.economy import _economic_calendar_payload
 from api_core.routes.stocks import list_stocks
 
 router = APIRouter(tags=["market"])
@@ -39,16 +40,23 @@ def _market_heatmap_payload():
         _, df = TvQuery().set_markets("turkey").select("name", "change", "volume", "sector").get_scanner_data()
         if df.empty:
             return []
-        heatmap = []
-        for _, row in df.head(50).iterrows():
-            heatmap.append({"symbol": str(row.get("name")), "change": round(float(row.get("change", 0)), 2), "volume": float(row.get("volume", 0)), "sector": str(row.get("sector", "N/A"))})
-        return heatmap
+        top = df.head(50)
+
+        def column(name, default):
+            # Missing columns fall back to a default, as row.get() did
+            return top[name].tolist() if name in top else [default] * len(top)
+
+        return [
+            {"symbol": str(name), "change": round(float(change), 2), "volume": float(volume), "sector": str(sector)}
+            for name, change, volume, sector in zip(column("name", None), column("change", 0), column("volume", 0), column("sector", "N/A"))
+        ]
     except Exception as exc:
         return {"error": str(exc)}
 
 
 @router.get("/market/screener")
 @limiter.limit("20/minute")
+@cache_response("market")
 def stock_screener(request: Request, response: Response, template: str | None = None, limit: int = 100, offset: int = 0, sort: str | None = None, direction: str = "desc", envelope: bool = False):
     def fetch():
         return _stock_screener_payload(template=template, limit=limit, offset=offset, sort=sort, direction=direction)
@@ -65,6 +73,7 @@ def stock_screener(request: Request, response: Response, template: str | None =
 
 @router.get("/analysis/{symbol}")
 @limiter.limit("20/minute")
+@cache_response("market")
 def get_analysis_pro(request: Request, response: Response, symbol: str):
     symbol = symbol.upper()
 
@@ -73,15 +82,16 @@ def get_analysis_pro(request: Request, response: Response, symbol: str):
         df = obj.history(period="1y")
         if df.empty:
             return {"error": "No history"}
-        rsi_s = technical.calculate_rsi(df)
+        # Only the latest indicator values are reported, so compute those
+        # scalars from the close array instead of full-year Series. Fund
+        # history names the column "Price", as borsapy.technical allows.
+        close = df["Close" if "Close" in df.columns else "Price"].to_numpy(dtype=np.float64)
+        rsi = last_rsi(close)
         super_df = technical.calculate_supertrend(df)
-        rsi = clean_json_val(rsi_s.iloc[-1])
         supertrend = clean_json_val(super_df["Supertrend"].iloc[-1]) if "Supertrend" in super_df else None
-        ma50_v = df["Close"].rolling(50).mean()
-        ma200_v = df["Close"].rolling(200).mean()
-        ma50 = clean_json_val(ma50_v.iloc[-1]) if len(ma50_v) > 0 else None
-        ma200 = clean_json_val(ma200_v.iloc[-1]) if len(ma200_v) > 0 else None
-        current = float(df["Close"].iloc[-1])
+        ma50 = clean_json_val(close[-50:].mean()) if len(close) >= 50 else None
+        ma200 = clean_json_val(close[-200:].mean()) if len(close) >= 200 else None
+        current = float(close[-1])
         return {
             "symbol": symbol,
             "rsi": rsi,
@@ -100,7 +110,10 @@ def get_analysis_pro(request: Request, response: Response, symbol: str):
 
 @router.get("/analysis/{symbol}/sentiment")
 @limiter.limit("10/minute")
+@cache_response("market")
 def get_sentiment_analysis(request: Request, response: Response, symbol: str):
+    symbol = symbol.upper()
+
     def fetch():
         try:
             import os
@@ -124,6 +137,7 @@ def get_sentiment_analysis(request: Request, response: Response, symbol: str):
 
 @router.get("/analysis/{symbol}/insight")
 @limiter.limit("10/minute")
+@cache_response("market")
 def get_hybrid_insight(request: Request, response: Response, symbol: str):
     symbol = symbol.upper()
 
@@ -200,6 +214,7 @@ def get_hybrid_insight(request: Request, response: Response, symbol: str):
 
 @router.get("/market/breadth")
 @limiter.limit("5/minute")
+@cache_response("realtime")
 def get_market_breadth(request: Request, response: Response):
     def fetch():
         try:
@@ -223,6 +238,7 @@ def get_market_breadth(request: Request, response: Response):
 
 @router.get("/market/heatmap")
 @limiter.limit("15/minute")
+@cache_response("market")
 def get_market_heatmap(request: Request, response: Response):
     def fetch():
         return _market_heatmap_payload()
@@ -232,6 +248,7 @@ def get_market_heatmap(request: Request, response: Response):
 
 @router.get("/market/summary")
 @limiter.limit("20/minute")
+@cache_response("market")
 def market_summary(request: Request, response: Response):
     def fetch():
         try:
@@ -251,7 +268,7 @@ def market_summary(request: Request, response: Response):
         heatmap = _market_heatmap_payload()
         movers = _stock_screener_payload(limit=6, offset=0)
         funds = _list_funds_payload(limit=6, offset=0)
-        calendar = get_economic_calendar(scope="week")
+        calendar = _economic_calendar_payload(scope="week")
         return api_ok({"breadth": breadth if isinstance(breadth, dict) else {}, "heatmap": heatmap if isinstance(heatmap, list) else [], "movers": movers if isinstance(movers, list) else [], "funds": funds if isinstance(funds, list) else [], "calendar": calendar[:6] if isinstance(calendar, list) else []})
 
     return get_cached_market("MARKET_SUMMARY", fetch)
@@ -259,6 +276,7 @@ def market_summary(request: Request, response: Response):
 
 @router.get("/home/highlights")
 @limiter.limit("20/minute")
+@cache_response("market")
 def home_highlights(request: Request, response: Response):
     def fetch():
         movers = _stock_screener_payload(limit=4, offset=0)
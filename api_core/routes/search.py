@@ -4,7 +4,7 @@ import os
 
 from fastapi import APIRouter, Depends, Query, Request, Response
 
-from api_core.services.cache import get_cached_market, get_cached_static
+from api_core.services.cache import cache_response, get_cached_market, get_cached_static
 from api_core.services.enrichers import enrich_stock_rows
 from api_core.services.normalizers import clean_json_val, compact_payload, df_to_json, normalize_fund_row
 from api_core.services.providers import Index, clear_twitter_auth, market, search_funds, search_tweets, set_twitter_auth
@@ -16,7 +16,10 @@ router = APIRouter(prefix="/search", tags=["search"])
 
 @router.get("/tweets", dependencies=[Depends(verify_api_key)])
 @limiter.limit("5/minute")
+@cache_response("market")
 def twitter_search(request: Request, response: Response, q: str, limit: int = 15):
+    q = q.strip()
+
     def fetch():
         try:
             env_token = os.getenv("TWITTER_AUTH_TOKEN")
@@ -39,7 +42,10 @@ def twitter_search(request: Request, response: Response, q: str, limit: int = 15
 
 @router.get("")
 @limiter.limit("30/minute")
+@cache_response("static")
 def unified_search(request: Request, response: Response, q: str, envelope: bool = False):
+    q = q.strip()
+
     def fetch():
         try:
             stocks = market.search_companies(q)
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-import json
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 
 import numpy as np
 import pandas as pd
 from fastapi import APIRouter, Query, Request, Response
 
-from api_core.services.cache import get_cached_market, get_cached_realtime, get_cached_static
+from api_core.services.cache import cache_response, get_cached_market, get_cached_realtime, get_cached_static
 from api_core.services.enrichers import enrich_stock_row, enrich_stock_rows
-from api_core.services.normalizers import clean_json_val, compact_payload, df_to_json
+from api_core.services.normalizers import clean_json_val, compact_payload, df_to_json, df_to_json_columns
 from api_core.services.providers import Ticker, Fund, get_kap_provider, market
 from api_core.services.response import api_ok, pagination_meta
 from api_core.services.security import limiter
@@ -16,11 +17,36 @@ from api_core.services.security import limiter
 router = APIRouter(prefix="/stocks", tags=["stocks"])
 
 
+def _stock_payload(symbol: str):
+    def fetch():
+        tk = Ticker(symbol)
+        try:
+            info = dict(tk.fast_info) if hasattr(tk, "fast_info") else dict(tk.info)
+        except Exception:
+            info = dict(tk.info)
+
+        def fetch_kap():
+            try:
+                kap = get_kap_provider()
+                return kap.get_company_details(symbol)
+            except Exception:
+                return {}
+
+        info["details"] = get_cached_static(f"KAP_DETAILS_{symbol}", fetch_kap)
+        return compact_payload({"symbol": symbol, "data": info})
+
+    return get_cached_market(f"STOCK_{symbol}", fetch)
+
+
 @router.get("/list")
 @limiter.limit("30/minute")
+@cache_response("static")
 def list_stocks(request: Request, response: Response, limit: int = 50, offset: int = 0, envelope: bool = False):
     def fetch():
         try:
+            companies = getattr(request.app.state, "company_rows", None)
+            if companies is not None:
+                return enrich_stock_rows(companies[offset : offset + limit])
             df = market.companies()
             if df.empty:
                 return []
@@ -39,44 +65,50 @@ def list_stocks(request: Request, response: Response, limit: int = 50, offset: i
 
 @router.get("/compare")
 @limiter.limit("20/minute")
+@cache_response("market")
 def compare(request: Request, response: Response, symbols: str = Query(...), envelope: bool = False):
     sym_list = [s.strip().upper() for s in symbols.split(",") if s.strip()]
 
     def fetch():
         return [enrich_stock_row({"symbol": symbol, "name": symbol}) for symbol in sym_list]
 
-    rows = get_cached_market(f"COMPARE_{symbols}", fetch)
+    rows = get_cached_market(f"COMPARE_{','.join(sym_list)}", fetch)
     meta = {"count": len(rows), "symbols": sym_list}
     return api_ok(rows, meta) if envelope else rows
 
 
-@router.get("/{symbol}")
-@limiter.limit("30/minute")
-def get_stock(request: Request, response: Response, symbol: str):
-    symbol = symbol.upper()
+@router.get("/batch")
+@limiter.limit("20/minute")
+@cache_response("market")
+def batch_stocks(request: Request, response: Response, symbols: str = Query(...)):
+    # dict.fromkeys dedupes while keeping request order; capped like a page
+    sym_list = list(dict.fromkeys(s.strip().upper() for s in symbols.split(",") if s.strip()))[:50]
 
-    def fetch():
-        tk = Ticker(symbol)
+    def fetch_one(symbol: str):
         try:
-            info = dict(tk.fast_info) if hasattr(tk, "fast_info") else dict(tk.info)
-        except Exception:
-            info = dict(tk.info)
+            return _stock_payload(symbol)
+        except Exception as exc:
+            return {"error": str(exc)}
 
-        def fetch_kap():
-            try:
-                kap = get_kap_provider()
-                return kap.get_company_details(symbol)
-            except Exception:
-                return {}
+    if not sym_list:
+        return {}
+    # Each worker runs in a copy of this context so cache_response still
+    # sees which payload entries the batch was built from
+    contexts = [copy_context() for _ in sym_list]
+    with ThreadPoolExecutor(max_workers=min(8, len(sym_list))) as executor:
+        return dict(zip(sym_list, executor.map(lambda ctx, symbol: ctx.run(fetch_one, symbol), contexts, sym_list)))
 
-        info["details"] = get_cached_static(f"KAP_DETAILS_{symbol}", fetch_kap)
-        return compact_payload({"symbol": symbol, "data": info})
 
-    return get_cached_market(f"STOCK_{symbol}", fetch)
+@router.get("/{symbol}")
+@limiter.limit("30/minute")
+@cache_response("market")
+def get_stock(request: Request, response: Response, symbol: str):
+    return _stock_payload(symbol.upper())
 
 
 @router.get("/{symbol}/history")
 @limiter.limit("30/minute")
+@cache_response("realtime")
 def get_history(request: Request, response: Response, symbol: str, period: str = "1mo", interval: str = "1d"):
     symbol = symbol.upper()
 
@@ -96,6 +128,7 @@ def get_history(request: Request, response: Response, symbol: str, period: str =
 
 @router.get("/{symbol}/depth")
 @limiter.limit("10/minute")
+@cache_response("realtime")
 def get_simulated_depth(request: Request, response: Response, symbol: str):
     symbol = symbol.upper()
 
@@ -113,16 +146,12 @@ def get_simulated_depth(request: Request, response: Response, symbol: str):
         hist["PriceBin"] = pd.cut(hist["Close"], bins=bins, labels=bins[:-1])
         vp = hist.groupby("PriceBin", observed=False)["Volume"].sum().reset_index()
         vp = vp.dropna().sort_values("PriceBin", ascending=False)
-        total_vol = vp["Volume"].sum()
-        result = []
-        for _, row in vp.iterrows():
-            result.append(
-                {
-                    "price": round(float(row["PriceBin"]), 2),
-                    "volume": int(row["Volume"]),
-                    "weight": round((row["Volume"] / total_vol) * 100, 1),
-                }
-            )
+        volumes = vp["Volume"].to_numpy()
+        weights = np.round(volumes / volumes.sum() * 100, 1)
+        result = [
+            {"price": round(price, 2), "volume": int(volume), "weight": weight}
+            for price, volume, weight in zip(vp["PriceBin"].astype(float).tolist(), volumes.tolist(), weights.tolist())
+        ]
         return {"symbol": symbol, "simulated_depth": result, "method": "Volume-at-Price Profile"}
 
     return get_cached_realtime(f"DEPTH_{symbol}", fetch)
@@ -130,7 +159,10 @@ def get_simulated_depth(request: Request, response: Response, symbol: str):
 
 @router.get("/{symbol}/disclosures")
 @limiter.limit("15/minute")
+@cache_response("market")
 def get_disclosures(request: Request, response: Response, symbol: str, limit: int = 15):
+    symbol = symbol.upper()
+
     def fetch():
         kap = get_kap_provider()
         return df_to_json(kap.get_disclosures(symbol, limit))
@@ -140,6 +172,7 @@ def get_disclosures(request: Request, response: Response, symbol: str, limit: in
 
 @router.get("/{symbol}/dividends")
 @limiter.limit("20/minute")
+@cache_response("static")
 def get_dividends(request: Request, response: Response, symbol: str):
     symbol = symbol.upper()
 
@@ -160,6 +193,7 @@ def get_dividends(request: Request, response: Response, symbol: str):
 
 @router.get("/{symbol}/financials")
 @limiter.limit("20/minute")
+@cache_response("static")
 def get_financials(request: Request, response: Response, symbol: str, type: str = "income"):
     symbol = symbol.upper()
 
@@ -174,7 +208,7 @@ def get_financials(request: Request, response: Response, symbol: str, type: str
                 df = tk.income_stmt
             if df is None or df.empty:
                 return {"error": "No data"}
-            return compact_payload(json.loads(df.to_json(date_format="iso")))
+            return compact_payload(df_to_json_columns(df))
         except Exception:
             return {"error": "Financial data currently unavailable"}
 
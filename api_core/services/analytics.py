@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 
 FINANCIAL_KEYWORDS = {
     "positive": ["tavan", "yükseliş", "alım", "rekor", "kar", "büyüme", "temettü", "pozitif", "destek", "hedef", "bullish", "buy", "profit", "growth", "dividend"],
@@ -28,3 +30,23 @@ def analyze_sentiment(text_list: list[str]) -> dict[str, object]:
         "mentions_detected": mentions,
         "sample_count": len(text_list),
     }
+
+
+def last_rsi(close: np.ndarray, period: int = 14) -> float | None:
+    """Latest Wilder RSI, matching borsapy.technical.calculate_rsi(...).iloc[-1].
+
+    The adjust=False EWM recursion is unrolled into one weighted dot product,
+    so no intermediate Series are built to read a single value.
+    """
+    if len(close) < period:
+        return None
+    delta = np.diff(close)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    alpha = 1 / period
+    weights = alpha * (1 - alpha) ** np.arange(len(delta) - 1, -1, -1)
+    avg_gain = float(gain @ weights)
+    avg_loss = float(loss @ weights)
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else 50.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
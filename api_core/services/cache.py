@@ -1,20 +1,36 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import heapq
 import json
 import threading
+import time
+from collections import Counter
 from collections.abc import Callable
-from dataclasses import dataclass
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import Any
-
-from cachetools import TTLCache
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
 
 from api_core.config import settings
+from api_core.services.response import FastJSONResponse
 
 try:
     import redis
 except ImportError:  # pragma: no cover - optional dependency in local dev
     redis = None
 
+# Sentinel for a single-lookup miss: fetches may legitimately cache None.
+_MISSING = object()
+
+# Earliest expiry (time.monotonic) of the payload entries read while a
+# response is being rendered; cache_response sets it so a rendered body
+# never outlives the data it was built from.
+_PAYLOAD_EXPIRY: ContextVar[list[float] | None] = ContextVar("payload_expiry", default=None)
+
 
 @dataclass(frozen=True)
 class CacheStats:
@@ -22,16 +38,86 @@ class CacheStats:
     maxsize: int
     ttl_seconds: int
     backend: str
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    top_keys: list[tuple[str, int]] = field(default_factory=list)
+
+
+class _ExpiringCache:
+    """Dict of key -> (expiry, value) on the time.monotonic clock.
+
+    A hit is one dict lookup and one clock compare; an entry found expired
+    is dropped then. Expired entries are only swept in bulk when an insert
+    finds the cache full, and if it is still full the tenth of entries
+    closest to expiry are evicted (counted in ``evictions``). Not
+    thread-safe: CacheNamespace holds its lock around every call.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, ttu: Callable[[str, Any, float], float] | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._ttu = ttu
+        self._data: dict[str, tuple[float, Any]] = {}
+        self.evictions = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return default
+        if item[0] <= time.monotonic():
+            del self._data[key]
+            return default
+        return item[1]
+
+    def expiry(self, key: str) -> float | None:
+        item = self._data.get(key)
+        return item[0] if item is not None else None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        now = time.monotonic()
+        expires = now + self.ttl if self._ttu is None else self._ttu(key, value, now)
+        if key not in self._data and len(self._data) >= self.maxsize:
+            self._make_room(now)
+        self._data[key] = (expires, value)
+
+    def _make_room(self, now: float) -> None:
+        self._data = {key: item for key, item in self._data.items() if item[0] > now}
+        if len(self._data) < self.maxsize:
+            return
+        doomed = heapq.nsmallest(max(1, self.maxsize // 10), self._data.items(), key=lambda kv: kv[1][0])
+        for key, _ in doomed:
+            del self._data[key]
+        self.evictions += len(doomed)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        now = time.monotonic()
+        return sum(1 for expires, _ in self._data.values() if expires > now)
 
 
 class CacheNamespace:
-    def __init__(self, name: str, maxsize: int, ttl_seconds: int, redis_client: Any = None):
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        ttl_seconds: int,
+        redis_client: Any = None,
+        ttu: Callable[[str, Any, float], float] | None = None,
+    ):
         self.name = name
         self.maxsize = maxsize
         self.ttl_seconds = ttl_seconds
         self._redis = redis_client
-        self._memory = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        # ttu (key, value, now) -> expiry gives entries their own deadline
+        self._memory = _ExpiringCache(maxsize, ttl_seconds, ttu)
         self._lock = threading.RLock()
+        self._inflight: dict[str, threading.Lock] = {}
+        self._hits = 0
+        self._misses = 0
+        self._key_hits: Counter[str] = Counter()
 
     def _redis_key(self, key: str) -> str:
         return f"borsapy:{self.name}:{key}"
@@ -55,16 +141,44 @@ class CacheNamespace:
         except Exception:
             return
 
+    def _record(self, key: str, hit: bool) -> None:
+        # Caller holds self._lock
+        if hit:
+            self._hits += 1
+            self._key_hits[key] += 1
+            return
+        self._misses += 1
+        if len(self._key_hits) > 2 * self.maxsize:
+            self._key_hits = Counter({k: n for k, n in self._key_hits.items() if k in self._memory})
+
+    def _served(self, key: str, value: Any) -> Any:
+        # Caller holds self._lock
+        expiries = _PAYLOAD_EXPIRY.get()
+        if expiries is not None:
+            expires = self._memory.expiry(key)
+            if expires is not None:
+                expiries.append(expires)
+        return value
+
     def get(self, key: str) -> Any | None:
         with self._lock:
-            if key in self._memory:
-                return self._memory[key]
+            value = self._memory.get(key, _MISSING)
+            if value is not _MISSING:
+                self._record(key, hit=True)
+                return self._served(key, value)
         value = self._get_redis(key)
-        if value is not None:
-            with self._lock:
+        with self._lock:
+            self._record(key, hit=value is not None)
+            if value is not None:
                 self._memory[key] = value
+                self._served(key, value)
         return value
 
+    def peek(self, key: str) -> Any | None:
+        """Memory-only lookup that is not counted in the hit/miss stats."""
+        with self._lock:
+            return self._memory.get(key)
+
     def set(self, key: str, value: Any) -> Any:
         with self._lock:
             self._memory[key] = value
@@ -76,21 +190,42 @@ class CacheNamespace:
         if cached is not None:
             return cached
         with self._lock:
-            if key in self._memory:
-                return self._memory[key]
-            value = func()
-            self._memory[key] = value
+            value = self._memory.get(key, _MISSING)
+            if value is not _MISSING:
+                return self._served(key, value)
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+        # Single-flight: concurrent misses for one key wait for the first
+        # fetch instead of repeating it, and other keys are not held up.
+        with key_lock:
+            with self._lock:
+                value = self._memory.get(key, _MISSING)
+                if value is not _MISSING:
+                    return self._served(key, value)
+            try:
+                value = func()
+                with self._lock:
+                    self._memory[key] = value
+                    self._served(key, value)
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
         self._set_redis(key, value)
         return value
 
     def stats(self) -> CacheStats:
         with self._lock:
             size = len(self._memory)
+            hits, misses, evictions = self._hits, self._misses, self._memory.evictions
+            top_keys = self._key_hits.most_common(20)
         return CacheStats(
             size=size,
             maxsize=self.maxsize,
             ttl_seconds=self.ttl_seconds,
             backend="redis+memory" if self._redis else "memory",
+            hits=hits,
+            misses=misses,
+            evictions=evictions,
+            top_keys=top_keys,
         )
 
 
@@ -122,9 +257,94 @@ def get_cached_static(key: str, func: Callable[[], Any]) -> Any:
     return STATIC_CACHE.get_or_set(key, func)
 
 
+def _response_ttu(ttl_seconds: int) -> Callable[[str, Any, float], float]:
+    # Entries are (body, headers, payload_expiry): never outlive the payload
+    def ttu(_key: str, value: tuple[bytes, dict[str, str], float], now: float) -> float:
+        return min(now + ttl_seconds, value[2])
+
+    return ttu
+
+
+# Rendered bodies stay in process memory; redis only holds JSON payloads.
+_RESPONSE_CACHES = {
+    namespace.name: CacheNamespace(
+        f"{namespace.name}_responses",
+        namespace.maxsize,
+        namespace.ttl_seconds,
+        ttu=_response_ttu(namespace.ttl_seconds),
+    )
+    for namespace in (REALTIME_CACHE, MARKET_CACHE, STATIC_CACHE)
+}
+
+
+def cache_response(namespace: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Memoize an endpoint's rendered JSON body by request path and query.
+
+    The wrapped endpoint becomes async: hits are answered on the event loop
+    without FastAPI's jsonable_encoder, JSON rendering or a worker-thread
+    hop, while misses run the sync endpoint and render it in the threadpool.
+    Headers the endpoint sets on its injected response are replayed.
+
+    A body expires with the earliest payload cache entry it was built from,
+    so it is never older than that payload's own TTL. Enveloped responses
+    (``envelope=true``) carry a per-request ``meta.generated_at`` and are
+    rendered every time.
+    """
+    responses = _RESPONSE_CACHES[namespace]
+    inflight: dict[str, asyncio.Lock] = {}
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        def render(*args: Any, **kwargs: Any) -> Any:
+            expiries: list[float] = []
+            token = _PAYLOAD_EXPIRY.set(expiries)
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                _PAYLOAD_EXPIRY.reset(token)
+            if isinstance(result, Response):
+                return result
+            sub_response = kwargs.get("response")
+            headers = dict(sub_response.headers) if sub_response is not None else {}
+            expires = min(expiries, default=time.monotonic() + responses.ttl_seconds)
+            return FastJSONResponse(jsonable_encoder(result)).body, headers, expires
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if kwargs.get("envelope"):
+                rendered = await run_in_threadpool(render, *args, **kwargs)
+                if isinstance(rendered, Response):
+                    return rendered
+                body, headers, _ = rendered
+                return Response(body, media_type="application/json", headers=headers)
+            request = kwargs["request"]
+            key = f"{request.url.path}?{request.url.query}"
+            cached = responses.get(key)
+            if cached is None:
+                # Concurrent misses for one URL queue here rather than each
+                # occupying a worker thread on the same upstream fetch.
+                key_lock = inflight.setdefault(key, asyncio.Lock())
+                async with key_lock:
+                    cached = responses.peek(key)
+                    if cached is None:
+                        try:
+                            cached = await run_in_threadpool(render, *args, **kwargs)
+                        finally:
+                            inflight.pop(key, None)
+                        if isinstance(cached, Response):
+                            return cached
+                        responses.set(key, cached)
+            body, headers, _ = cached
+            return Response(body, media_type="application/json", headers=headers)
+
+        return wrapper
+
+    return decorator
+
+
 def cache_overview() -> dict[str, dict[str, Any]]:
     return {
         "realtime": REALTIME_CACHE.stats().__dict__,
         "market": MARKET_CACHE.stats().__dict__,
         "static": STATIC_CACHE.stats().__dict__,
+        "responses": {name: cache.stats().__dict__ for name, cache in _RESPONSE_CACHES.items()},
     }
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import math
 import unicodedata
 from typing import Any
 
@@ -8,11 +9,25 @@ import numpy as np
 
 from api_core.services.response import now_iso
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency in local dev
+    orjson = None
+
+
+def _json_loads(raw: str) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 
 def clean_json_val(val: Any) -> Any:
     """Safely handle NaN/Inf while preserving valid zeros."""
     if val is None:
         return None
+    # Fast paths for the common scalar types; np.float64 is a float subclass
+    if isinstance(val, float):
+        return val if math.isfinite(val) else None
+    if isinstance(val, (str, int)):
+        return val
     try:
         if np.isnan(val) or np.isinf(val):
             return None
@@ -49,7 +64,15 @@ def df_to_json(data: Any) -> list[dict[str, Any]]:
         return [{k: clean_json_val(v) for k, v in item.items()} if isinstance(item, dict) else item for item in data]
     if hasattr(data, "empty") and data.empty:
         return []
-    return json.loads(data.to_json(orient="records", date_format="iso"))
+    # pandas writes JSON in C (NaN/Inf -> null); decode it back with orjson when available
+    return _json_loads(data.to_json(orient="records", date_format="iso"))
+
+
+def df_to_json_columns(data: Any) -> dict[str, Any]:
+    """Column-keyed counterpart of df_to_json for statement-style frames."""
+    if data is None or (hasattr(data, "empty") and data.empty):
+        return {}
+    return _json_loads(data.to_json(date_format="iso"))
 
 
 def infer_fund_risk(*texts: Any) -> int | None:
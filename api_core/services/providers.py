@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import os
 import re
 import sys
@@ -40,7 +41,12 @@ from borsapy import (  # type: ignore
     tax,
     technical,
 )
+from borsapy._providers.bist_index import get_bist_index_provider  # type: ignore
 from borsapy._providers.kap import get_kap_provider  # type: ignore
+from borsapy._providers.tcmb_rates import get_tcmb_rates_provider  # type: ignore
+from borsapy._providers.ziraat_eurobond import get_eurobond_provider  # type: ignore
+
+logger = logging.getLogger("borsapy.api")
 
 
 def parse_fund_holdings_no_llm(fund_code: str):
@@ -59,7 +65,7 @@ def parse_fund_holdings_no_llm(fund_code: str):
 
         pdr_type = "8aca490d502e34b801502e380044002b"
         disclosures = None
-        print(f"DEBUG: Found {len(set(oids))} potential OIDs for {fund_code}")
+        logger.debug("Found %d potential OIDs for %s", len(set(oids)), fund_code)
         for fund_oid in set(oids):
             try:
                 filter_url = f"https://kap.org.tr/tr/api/disclosure/filter/FILTERYFBF/{fund_oid}/{pdr_type}/365"
@@ -67,35 +73,35 @@ def parse_fund_holdings_no_llm(fund_code: str):
                 if f_resp.status_code == 200:
                     data = f_resp.json()
                     if data:
-                        print(f"DEBUG: Found valid OID: {fund_oid}")
+                        logger.debug("Found valid OID: %s", fund_oid)
                         disclosures = data
                         break
             except Exception:
                 continue
 
         if not disclosures:
-            print(f"DEBUG: No PDR disclosures found for {fund_code}")
+            logger.debug("No PDR disclosures found for %s", fund_code)
             return None
 
         latest_idx = disclosures[0]["disclosureBasic"]["disclosureIndex"]
-        print(f"DEBUG: Latest PDR Index: {latest_idx}")
+        logger.debug("Latest PDR index: %s", latest_idx)
 
         disc_page = f"https://www.kap.org.tr/tr/Bildirim/{latest_idx}"
         resp = httpx.get(disc_page, timeout=10)
         file_id_match = re.search(r"file/download/([a-f0-9]{32})", resp.text)
         if not file_id_match:
-            print(f"DEBUG: File ID not found in disclosure {latest_idx}")
+            logger.debug("File ID not found in disclosure %s", latest_idx)
             return None
 
         file_id = file_id_match.group(1)
-        print(f"DEBUG: Downloading PDF {file_id}")
+        logger.debug("Downloading PDF %s", file_id)
         pdf_url = f"https://kap.org.tr/tr/api/file/download/{file_id}"
         headers = {"User-Agent": "Mozilla/5.0"}
         resp = httpx.get(pdf_url, headers=headers, timeout=30)
         data = resp.content
         pdf_start = data.find(b"%PDF-")
         if pdf_start == -1:
-            print(f"DEBUG: Valid PDF header not found for {fund_code}")
+            logger.debug("Valid PDF header not found for %s", fund_code)
             return None
 
         pdf_data = data[pdf_start:]
@@ -103,9 +109,9 @@ def parse_fund_holdings_no_llm(fund_code: str):
         text = ""
         for page in doc:
             text += page.get_text()
-        print(f"DEBUG: PDF text extracted, length: {len(text)}")
+        logger.debug("PDF text extracted, length: %d", len(text))
 
-        print("DEBUG: Starting Regex scan for holdings...")
+        logger.debug("Starting regex scan for holdings")
         unique_stocks: dict[str, float] = {}
         try:
             bist_tickers = set(market.companies()["ticker"].tolist())
@@ -135,5 +141,5 @@ def parse_fund_holdings_no_llm(fund_code: str):
 
         return [{"symbol": symbol, "weight": weight} for symbol, weight in unique_stocks.items()]
     except Exception as exc:
-        print(f"Deep Parsing Error for {fund_code}: {exc}")
+        logger.warning("Deep parsing error for %s: %s", fund_code, exc)
         return None
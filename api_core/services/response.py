@@ -4,9 +4,31 @@ from datetime import datetime
 from typing import Any
 from zoneinfo import ZoneInfo
 
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency in local dev
+    orjson = None
+
+_ISTANBUL_TZ = ZoneInfo("Europe/Istanbul")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is installed.
+
+    fastapi.responses.ORJSONResponse is deprecated in favour of response
+    models, which these routes do not declare, so this keeps the fast path.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
 
 def now_iso() -> str:
-    return datetime.now(ZoneInfo("Europe/Istanbul")).isoformat()
+    return datetime.now(_ISTANBUL_TZ).isoformat()
 
 
 def api_ok(data: Any, meta: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -10,12 +10,19 @@ from borsapy.cache import Cache, get_cache
 class BaseProvider:
     """Base class for all data providers."""
 
+    # Subclasses without their own __slots__ still get a __dict__ as usual
+    __slots__ = ("_client", "_cache", "__weakref__")
+
     DEFAULT_HEADERS = {
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Accept": "application/json, text/plain, */*",
         "Accept-Language": "tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7",
     }
 
+    # Connection pool size and connect-error retries for the shared client
+    MAX_CONNECTIONS = 32
+    CONNECT_RETRIES = 2
+
     def __init__(
         self,
         timeout: float = 30.0,
@@ -30,8 +37,22 @@ class BaseProvider:
             cache: Cache instance to use. If None, uses global cache.
             verify: Whether to verify SSL certificates.
         """
+        # One pooled client per provider: keep-alive connections are reused
+        # across calls, and connect failures are retried by the transport.
+        # limits/verify are repeated on the transport since httpx only applies
+        # the client-level ones to transports it builds itself (e.g. proxies).
+        limits = httpx.Limits(
+            max_connections=self.MAX_CONNECTIONS,
+            max_keepalive_connections=self.MAX_CONNECTIONS,
+        )
         self._client = httpx.Client(
-            timeout=timeout, headers=self.DEFAULT_HEADERS, verify=verify
+            timeout=timeout,
+            headers=self.DEFAULT_HEADERS,
+            verify=verify,
+            limits=limits,
+            transport=httpx.HTTPTransport(
+                verify=verify, limits=limits, retries=self.CONNECT_RETRIES
+            ),
         )
         self._cache = cache or get_cache()
 
@@ -1,8 +1,21 @@
 """BIST index constituent provider - downloads index components from BIST CSV."""
 
-from io import StringIO
-from typing import Any
-
+import asyncio
+import contextlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+from collections import namedtuple
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple
+
+import httpx
+import numpy as np
 import pandas as pd
 
 from borsapy._providers.base import BaseProvider
@@ -11,15 +24,78 @@ from borsapy.cache import TTL
 # BIST index components CSV URL
 INDEX_COMPONENTS_URL = "https://www.borsaistanbul.com/datum/hisse_endeks_ds.csv"
 
+# CSV columns used to build the constituent lookups
+COMPONENT_COLUMNS = ["BILESEN KODU", "BULTEN_ADI", "ENDEKS KODU", "ENDEKS ADI"]
+
+# Read size when streaming the CSV body into the parser
+STREAM_CHUNK_SIZE = 1 << 15
+
+# In-memory cache key for the derived component lookups
+COMPONENTS_CACHE_KEY = "bist:index:components:all"
+
+# On-disk Parquet copy of the cleaned components, revalidated with ETag / Last-Modified
+DISK_CACHE_DIR = Path(os.getenv("BORSAPY_CACHE_DIR") or Path(tempfile.gettempdir()) / "borsapy")
+COMPONENTS_PARQUET_PATH = DISK_CACHE_DIR / "bist_index_components.parquet"
+COMPONENTS_META_PATH = DISK_CACHE_DIR / "bist_index_components.json"
+
+# Compact per-row record for stored index components
+Component = namedtuple("Component", "symbol name")
+
+
+class _LoopState(NamedTuple):
+    """Async download primitives bound to one event loop."""
+
+    lock: asyncio.Lock
+    client: httpx.AsyncClient
+
+
+def _replace_atomically(path: Path, write: Callable[[str], Any]) -> None:
+    """Call write() on a temp file next to path, then move it over path."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only raw file object over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
 # Singleton instance
 _provider: "BistIndexProvider | None" = None
+_provider_lock = threading.Lock()
 
 
 def get_bist_index_provider() -> "BistIndexProvider":
     """Get or create the singleton BistIndexProvider instance."""
     global _provider
     if _provider is None:
-        _provider = BistIndexProvider()
+        with _provider_lock:
+            if _provider is None:
+                _provider = BistIndexProvider()
     return _provider
 
 
@@ -28,37 +104,288 @@ class BistIndexProvider(BaseProvider):
 
     def __init__(self):
         super().__init__(timeout=30.0)
-        self._df_cache: pd.DataFrame | None = None
+        # Lookup structures derived from the components DataFrame. The frame
+        # itself is not retained once these are built.
+        self._loaded = False
+        self._by_index: dict[str, list[Component]] = {}
+        self._by_symbol: dict[str, tuple[str, ...]] = {}
+        self._pairs: set[tuple[str, str]] = set()
+        self._available_indices: list[dict[str, Any]] = []
+        # Serializes downloads so concurrent callers share one fetch
+        self._download_lock = threading.RLock()
+        # asyncio.Lock and AsyncClient are tied to the loop they first run on
+        self._loop_states: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopState
+        ] = weakref.WeakKeyDictionary()
+        self._loop_states_lock = threading.Lock()
+
+    def _build_lookups(self, df: pd.DataFrame) -> dict[str, Any]:
+        """Precompute per-index and per-symbol lookups from the components DataFrame."""
+        by_index: dict[str, list[Component]] = {}
+        for code, sym, name in zip(
+            df["index_code"].to_numpy(), df["symbol"].to_numpy(), df["name"].to_numpy()
+        ):
+            if isinstance(code, str):
+                by_index.setdefault(code, []).append(Component(sym, name))
+        by_symbol = {
+            sym: tuple(sorted(set(codes.tolist())))
+            for sym, codes in df.groupby("symbol", sort=False, observed=True)["index_code"]
+        }
+        pairs = set(zip(df["symbol"], df["index_code"]))
+
+        # Count rows per index code (index_code -> index_name is 1:1)
+        valid = df[df["index_code"].notna()]
+        codes = valid["index_code"].to_numpy()
+        names = dict(zip(codes, valid["index_name"].to_numpy()))
+        unique_codes, counts = np.unique(codes, return_counts=True)
+        # np.unique output is already sorted by code
+        available_indices = [
+            {"symbol": code, "name": names[code], "count": int(count)}
+            for code, count in zip(unique_codes.tolist(), counts.tolist())
+        ]
 
-    def _download_components(self) -> pd.DataFrame | None:
-        """Download and cache the components CSV."""
-        if self._df_cache is not None:
-            return self._df_cache
+        return {
+            "by_index": by_index,
+            "by_symbol": by_symbol,
+            "pairs": pairs,
+            "available_indices": available_indices,
+        }
+
+    def _set_lookups(self, lookups: dict[str, Any]) -> None:
+        """Install derived component lookups on the instance."""
+        self._by_index = lookups["by_index"]
+        self._by_symbol = lookups["by_symbol"]
+        self._pairs = lookups["pairs"]
+        self._available_indices = lookups["available_indices"]
+        self._loaded = True
+
+    def _download_components(self) -> bool:
+        """
+        Download the components CSV and build the lookups.
 
-        # Check memory cache first
-        cache_key = "bist:index:components:all"
-        cached = self._cache_get(cache_key)
-        if cached is not None:
-            self._df_cache = cached
-            return cached
+        Returns:
+            True if lookups are available, False if the fetch failed.
+        """
+        if self._loaded:
+            return True
+
+        with self._download_lock:
+            # Another thread may have finished the download while we waited
+            if self._loaded:
+                return True
+
+            # Check memory cache first
+            cached = self._cache_get(COMPONENTS_CACHE_KEY)
+            if cached is not None:
+                self._set_lookups(cached)
+                return True
+
+            try:
+                df = self._read_fresh_disk_cache()
+                if df is None:
+                    # Stream the body into the CSV parser so download and parse overlap
+                    with self._client.stream(
+                        "GET", INDEX_COMPONENTS_URL, headers=self._conditional_headers()
+                    ) as response:
+                        body = io.BufferedReader(
+                            _ChunkReader(response.iter_bytes(STREAM_CHUNK_SIZE)),
+                            buffer_size=STREAM_CHUNK_SIZE,
+                        )
+                        df = self._components_from_response(response, body)
+                self._install_components(df)
+                return True
+            except Exception:
+                return False
+
+    async def _adownload_components(self) -> bool:
+        """Async variant of _download_components for use inside event loops."""
+        if self._loaded:
+            return True
+
+        state = self._loop_state()
+        async with state.lock:
+            # Another coroutine may have finished the download while we waited
+            if self._loaded:
+                return True
+
+            cached = self._cache_get(COMPONENTS_CACHE_KEY)
+            if cached is not None:
+                self._set_lookups(cached)
+                return True
+
+            try:
+                df = await asyncio.to_thread(self._read_fresh_disk_cache)
+                if df is None:
+                    response = await state.client.get(
+                        INDEX_COMPONENTS_URL, headers=self._conditional_headers()
+                    )
+                    # CSV / Parquet parsing is CPU-bound: keep it off the event loop
+                    df = await asyncio.to_thread(self._components_from_response, response)
+                await asyncio.to_thread(self._install_components, df)
+                return True
+            except Exception:
+                return False
+
+    def _loop_state(self) -> _LoopState:
+        """
+        Download lock and AsyncClient for the running event loop.
 
-        try:
-            response = self._get(INDEX_COMPONENTS_URL)
-            df = pd.read_csv(StringIO(response.text), sep=";")
-            # Skip header row (has English column names)
-            df = df.iloc[1:]
-            # Clean up symbol codes (remove .E suffix)
-            df["symbol"] = df["BILESEN KODU"].str.replace(r"\.E$", "", regex=True)
-            df["name"] = df["BULTEN_ADI"]
-            df["index_code"] = df["ENDEKS KODU"]
-            df["index_name"] = df["ENDEKS ADI"]
-
-            self._df_cache = df
-            self._cache_set(cache_key, df, TTL.COMPANY_LIST)
+        Created on first use in each loop and reused by every later download
+        there, so revalidations keep their pooled connection. The client is
+        not closed when the loop goes away: await aclose() before then.
+        """
+        loop = asyncio.get_running_loop()
+        with self._loop_states_lock:
+            state = self._loop_states.get(loop)
+            if state is None:
+                state = _LoopState(
+                    asyncio.Lock(),
+                    httpx.AsyncClient(
+                        timeout=self._client.timeout,
+                        headers=self.DEFAULT_HEADERS,
+                        transport=httpx.AsyncHTTPTransport(retries=self.CONNECT_RETRIES),
+                    ),
+                )
+                self._loop_states[loop] = state
+            return state
+
+    async def aclose(self) -> None:
+        """
+        Close the running event loop's AsyncClient, if one was created.
+
+        Call before a loop that used the async download methods shuts down;
+        a later download on the same loop opens a new client.
+        """
+        loop = asyncio.get_running_loop()
+        with self._loop_states_lock:
+            state = self._loop_states.pop(loop, None)
+        if state is not None:
+            await state.client.aclose()
+
+    def _install_components(self, df: pd.DataFrame) -> None:
+        """Build lookups for a fresh DataFrame and store them in both caches."""
+        lookups = self._build_lookups(df)
+        self._set_lookups(lookups)
+        self._cache_set(COMPONENTS_CACHE_KEY, lookups, TTL.COMPANY_LIST)
+
+    def _conditional_headers(self) -> dict[str, str] | None:
+        """If-None-Match / If-Modified-Since headers from the previous download."""
+        meta = self._read_disk_meta()
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers or None
+
+    def _components_from_response(
+        self, response: httpx.Response, body: BinaryIO | None = None
+    ) -> pd.DataFrame:
+        """
+        Turn a (possibly conditional) CSV response into the cleaned DataFrame.
+
+        On 304 the cleaned DataFrame is loaded from Parquet instead of
+        reparsing a new CSV body.
+
+        Args:
+            response: Response for the components CSV request.
+            body: Binary reader over a streamed body. Defaults to the
+                already-read response content.
+
+        Returns:
+            Cleaned components DataFrame.
+        """
+        if response.status_code == 304 and COMPONENTS_PARQUET_PATH.exists():
+            df = pd.read_parquet(COMPONENTS_PARQUET_PATH)
+            # Revalidated: restart the freshness window
+            COMPONENTS_PARQUET_PATH.touch()
             return df
+        response.raise_for_status()
+
+        if body is None:
+            body = io.BytesIO(response.content)
+        df = self._parse_components(body, response.encoding or "utf-8")
+        self._write_disk_cache(
+            df,
+            {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            },
+        )
+        return df
+
+    def _read_fresh_disk_cache(self) -> pd.DataFrame | None:
+        """Load the Parquet copy if it is younger than TTL.COMPANY_LIST."""
+        try:
+            if time.time() - COMPONENTS_PARQUET_PATH.stat().st_mtime > TTL.COMPANY_LIST:
+                return None
+            return pd.read_parquet(COMPONENTS_PARQUET_PATH)
         except Exception:
             return None
 
+    def _read_disk_meta(self) -> dict[str, Any]:
+        """Read validators for the on-disk copy. Empty dict if missing."""
+        try:
+            if not COMPONENTS_PARQUET_PATH.exists():
+                return {}
+            return json.loads(COMPONENTS_META_PATH.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+
+    def _write_disk_cache(self, df: pd.DataFrame, meta: dict[str, Any]) -> None:
+        """
+        Store the cleaned DataFrame and its validators; failures are ignored.
+
+        Each file is written to a temp file in the cache directory and
+        os.replace()d into place, so readers (other processes included) never
+        see a partial file. The old validators are dropped before the Parquet
+        is swapped and the new ones written last, so they never describe a
+        different copy than the one on disk.
+        """
+        try:
+            DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            COMPONENTS_META_PATH.unlink(missing_ok=True)
+            _replace_atomically(
+                COMPONENTS_PARQUET_PATH,
+                lambda path: df.to_parquet(path, compression="snappy", index=False),
+            )
+            _replace_atomically(
+                COMPONENTS_META_PATH,
+                lambda path: Path(path).write_text(json.dumps(meta), encoding="utf-8"),
+            )
+        except Exception:
+            pass
+
+    def _parse_components(self, body: BinaryIO, encoding: str) -> pd.DataFrame:
+        """Parse a binary components CSV stream into the cleaned DataFrame."""
+        raw = pd.read_csv(
+            body,
+            sep=";",
+            encoding=encoding,
+            usecols=COMPONENT_COLUMNS,
+            dtype="string",
+            # Skip second header row (has English column names)
+            skiprows=[1],
+            engine="c",
+        )
+        # Clean up symbol codes (remove .E suffix). Lookup keys are canonicalized
+        # to upper case here so lookups only need to normalize user input.
+        symbols = [code.upper() if isinstance(code, str) else code for code in raw["BILESEN KODU"].tolist()]
+        symbols = [
+            code[:-2] if isinstance(code, str) and code.endswith(".E") else code
+            for code in symbols
+        ]
+        # Build the result in one allocation instead of adding columns to the parsed
+        # frame. Repeated short strings are stored as categories.
+        return pd.DataFrame(
+            {
+                "symbol": pd.Categorical(symbols),
+                "name": raw["BULTEN_ADI"],
+                "index_code": raw["ENDEKS KODU"].str.upper().astype("category"),
+                "index_name": raw["ENDEKS ADI"].astype("category"),
+            }
+        )
+
     def get_components(self, symbol: str) -> list[dict[str, Any]]:
         """
         Get constituent stocks for an index.
@@ -77,15 +404,54 @@ class BistIndexProvider(BaseProvider):
         """
         symbol = symbol.upper()
 
-        df = self._download_components()
-        if df is None:
+        if not self._download_components():
+            return []
+
+        return [
+            {"symbol": c.symbol, "name": c.name} for c in self._by_index.get(symbol, ())
+        ]
+
+    async def aget_components(self, symbol: str) -> list[dict[str, Any]]:
+        """
+        Async variant of get_components.
+
+        The CSV download runs on httpx.AsyncClient and parsing is offloaded
+        to a worker thread; concurrent awaiters share one in-flight download.
+
+        Args:
+            symbol: Index symbol (e.g., "XU100", "XU030", "XKTUM").
+
+        Returns:
+            List of component dicts with 'symbol' and 'name' keys.
+            Empty list if index not found or fetch fails.
+        """
+        symbol = symbol.upper()
+
+        if not await self._adownload_components():
             return []
 
-        # Filter by index code
-        mask = df["index_code"] == symbol
-        components = df[mask][["symbol", "name"]].to_dict("records")
+        return [
+            {"symbol": c.symbol, "name": c.name} for c in self._by_index.get(symbol, ())
+        ]
+
+    def get_component_symbols(self, symbol: str) -> list[str]:
+        """
+        Get just the ticker symbols of an index's constituents.
 
-        return components
+        Cheaper than get_components when names are not needed.
+
+        Args:
+            symbol: Index symbol (e.g., "XU100", "XU030", "XKTUM").
+
+        Returns:
+            List of stock symbols. Empty list if index not found or fetch fails.
+        """
+        symbol = symbol.upper()
+
+        if not self._download_components():
+            return []
+
+        return [c.symbol for c in self._by_index.get(symbol, ())]
 
     def get_available_indices(self) -> list[dict[str, Any]]:
         """
@@ -94,18 +460,10 @@ class BistIndexProvider(BaseProvider):
         Returns:
             List of dicts with 'symbol', 'name', and 'count' keys.
         """
-        df = self._download_components()
-        if df is None:
+        if not self._download_components():
             return []
 
-        # Group by index code
-        grouped = df.groupby(["index_code", "index_name"]).size().reset_index(name="count")
-        indices = [
-            {"symbol": row["index_code"], "name": row["index_name"], "count": row["count"]}
-            for _, row in grouped.iterrows()
-        ]
-
-        return sorted(indices, key=lambda x: x["symbol"])
+        return list(self._available_indices)
 
     def is_in_index(self, ticker: str, index_symbol: str) -> bool:
         """
@@ -121,12 +479,10 @@ class BistIndexProvider(BaseProvider):
         ticker = ticker.upper()
         index_symbol = index_symbol.upper()
 
-        df = self._download_components()
-        if df is None:
+        if not self._download_components():
             return False
 
-        mask = (df["symbol"] == ticker) & (df["index_code"] == index_symbol)
-        return mask.any()
+        return (ticker, index_symbol) in self._pairs
 
     def get_indices_for_ticker(self, ticker: str) -> list[str]:
         """
@@ -140,11 +496,7 @@ class BistIndexProvider(BaseProvider):
         """
         ticker = ticker.upper()
 
-        df = self._download_components()
-        if df is None:
+        if not self._download_components():
             return []
 
-        mask = df["symbol"] == ticker
-        indices = df[mask]["index_code"].unique().tolist()
-
-        return sorted(indices)
+        return list(self._by_symbol.get(ticker, ()))
@@ -1,16 +1,58 @@
 """Canlidoviz.com provider for forex data - token-free alternative to doviz.com."""
 
+import asyncio
+import json
 import re
+import threading
 from datetime import datetime, timedelta
-from typing import Any
+from datetime import time as dt_time
+from functools import lru_cache
+from html import unescape
+from typing import Any, NamedTuple
 
+import httpx
+import lxml.html
 import pandas as pd
-from bs4 import BeautifulSoup
+from dateutil.tz import tzlocal
+from lxml import etree
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json fallback
+    orjson = None
 
 from borsapy._providers.base import BaseProvider
 from borsapy.cache import TTL
 from borsapy.exceptions import APIError, DataNotAvailableError
 
+# History period -> lookback in days (unknown periods default to 30)
+_PERIOD_DAYS: dict[str, int] = {
+    "1d": 1,
+    "5d": 5,
+    "1mo": 30,
+    "3mo": 90,
+    "6mo": 180,
+    "1y": 365,
+    "2y": 730,
+    "5y": 1825,
+    "max": 3650,
+}
+
+# Bank rates page parsing, compiled once at import
+# Links shaped /doviz-kurlari/{bank-slug}/{currency-slug}; $suffix is "/{currency-slug}"
+_BANK_LINKS_XPATH = etree.XPath(
+    '//a[contains(@href, "/doviz-kurlari/")'
+    " and substring(@href, string-length(@href) - string-length($suffix) + 1) = $suffix]"
+)
+# Buy / sell TDs following the TD that holds the bank link
+_VALUE_TDS_XPATH = etree.XPath("ancestor::td[1]/following-sibling::td[position() <= 2]")
+# Tag boundaries for pulling text out of raw HTML fragments
+_TAG_RE = re.compile(r"<[^>]*>")
+# Trailing update time in bank names (e.g., "AKBANK15:57:42")
+_TIMESTAMP_RE = re.compile(r"\s*\d{2}:\d{2}:\d{2}$")
+# Leading decimal number (sell price) in "43.79000.54%-1.21"
+_PRICE_RE = re.compile(r"^(\d+[.,]\d+)")
+
 
 class CanlidovizProvider(BaseProvider):
     """
@@ -24,9 +66,14 @@ class CanlidovizProvider(BaseProvider):
     - Precious metal rates (gram-altin, etc.)
     """
 
+    __slots__ = ("_headers",)
+
     API_BASE = "https://a.canlidoviz.com"
     WEB_BASE = "https://canlidoviz.com"
 
+    # Upper bound on in-flight history requests in aget_many_history
+    MAX_CONCURRENT_REQUESTS = 16
+
     # Main currency IDs (TRY prices) - 65 currencies
     # Discovered via Chrome DevTools network inspection on 2026-01-13
     CURRENCY_IDS = {
@@ -371,24 +418,70 @@ class CanlidovizProvider(BaseProvider):
         "kuveyt-turk": 1013,
     }
 
+    # Per-asset bank ID tables (currencies by upper-case code, metals by slug)
+    _BANK_ID_TABLES: dict[str, dict[str, int]] = {
+        "USD": BANK_USD_IDS,
+        "EUR": BANK_EUR_IDS,
+        "GBP": BANK_GBP_IDS,
+        "CHF": BANK_CHF_IDS,
+        "CAD": BANK_CAD_IDS,
+        "AUD": BANK_AUD_IDS,
+        "JPY": BANK_JPY_IDS,
+        "RUB": BANK_RUB_IDS,
+        "SAR": BANK_SAR_IDS,
+        "AED": BANK_AED_IDS,
+        "CNY": BANK_CNY_IDS,
+        "gram-altin": BANK_GRAM_ALTIN_IDS,
+        "gumus": BANK_GUMUS_IDS,
+        "gram-platin": BANK_PLATIN_IDS,
+    }
+
+    # Flattened lookups, built once: (asset, bank slug) -> ID and asset -> ID.
+    # Metal slugs are lower-case, so they never collide with upper-cased codes.
+    _BANK_IDS: dict[tuple[str, str], int] = {
+        (asset, slug): item_id
+        for asset, table in _BANK_ID_TABLES.items()
+        for slug, item_id in table.items()
+    }
+    _MAIN_IDS: dict[str, int] = {**COMMODITY_IDS, **ENERGY_IDS, **METAL_IDS, **CURRENCY_IDS}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Rebuild the flattened lookups from a subclass's own tables, unless
+        # it overrides the lookups directly
+        if "_BANK_IDS" not in cls.__dict__:
+            cls._BANK_IDS = {
+                (asset, slug): item_id
+                for asset, table in cls._BANK_ID_TABLES.items()
+                for slug, item_id in table.items()
+            }
+        if "_MAIN_IDS" not in cls.__dict__:
+            cls._MAIN_IDS = {
+                **cls.COMMODITY_IDS, **cls.ENERGY_IDS, **cls.METAL_IDS, **cls.CURRENCY_IDS
+            }
+
     def __init__(self):
         super().__init__()
-
-    def _get_headers(self) -> dict[str, str]:
-        """Get request headers - no token needed!"""
-        return {
+        # Per-call overrides; User-Agent etc. come from the client defaults
+        self._headers = {
             "Accept": "*/*",
             "Origin": self.WEB_BASE,
             "Referer": f"{self.WEB_BASE}/",
-            "User-Agent": self.DEFAULT_HEADERS["User-Agent"],
         }
 
-    def _get_item_id(
-        self, asset: str, institution: str | None = None
-    ) -> int | None:
+    def _get_headers(self) -> dict[str, str]:
+        """Get request headers - no token needed!"""
+        return self._headers
+
+    @classmethod
+    def _get_item_id(cls, asset: str, institution: str | None = None) -> int | None:
         """
         Get canlidoviz item ID for an asset.
 
+        Memoized per class (misses included): the lookup tables are class
+        constants, which subclasses may override. Use
+        _lookup_item_id.cache_clear() after patching them.
+
         Args:
             asset: Currency code (USD, EUR) or metal (gram-altin).
             institution: Optional bank/institution slug.
@@ -396,54 +489,7 @@ class CanlidovizProvider(BaseProvider):
         Returns:
             Item ID or None if not found.
         """
-        asset_upper = asset.upper()
-
-        if institution:
-            # Convert dovizcom slug to canlidoviz slug if needed
-            inst_slug = self.DOVIZCOM_TO_CANLIDOVIZ.get(institution, institution)
-
-            # Bank-specific ID
-            if asset_upper == "USD":
-                return self.BANK_USD_IDS.get(inst_slug)
-            elif asset_upper == "EUR":
-                return self.BANK_EUR_IDS.get(inst_slug)
-            elif asset_upper == "GBP":
-                return self.BANK_GBP_IDS.get(inst_slug)
-            elif asset_upper == "CHF":
-                return self.BANK_CHF_IDS.get(inst_slug)
-            elif asset_upper == "CAD":
-                return self.BANK_CAD_IDS.get(inst_slug)
-            elif asset_upper == "AUD":
-                return self.BANK_AUD_IDS.get(inst_slug)
-            elif asset_upper == "JPY":
-                return self.BANK_JPY_IDS.get(inst_slug)
-            elif asset_upper == "RUB":
-                return self.BANK_RUB_IDS.get(inst_slug)
-            elif asset_upper == "SAR":
-                return self.BANK_SAR_IDS.get(inst_slug)
-            elif asset_upper == "AED":
-                return self.BANK_AED_IDS.get(inst_slug)
-            elif asset_upper == "CNY":
-                return self.BANK_CNY_IDS.get(inst_slug)
-            elif asset == "gram-altin":
-                return self.BANK_GRAM_ALTIN_IDS.get(inst_slug)
-            elif asset == "gumus":
-                return self.BANK_GUMUS_IDS.get(inst_slug)
-            elif asset == "gram-platin":
-                return self.BANK_PLATIN_IDS.get(inst_slug)
-            return None
-
-        # Main asset ID
-        if asset_upper in self.CURRENCY_IDS:
-            return self.CURRENCY_IDS[asset_upper]
-        if asset in self.METAL_IDS:
-            return self.METAL_IDS[asset]
-        if asset_upper in self.ENERGY_IDS:
-            return self.ENERGY_IDS[asset_upper]
-        if asset_upper in self.COMMODITY_IDS:
-            return self.COMMODITY_IDS[asset_upper]
-
-        return None
+        return _lookup_item_id(cls, asset, institution)
 
     def get_history(
         self,
@@ -470,6 +516,162 @@ class CanlidovizProvider(BaseProvider):
             DataNotAvailableError: If asset is not supported.
             APIError: If API request fails.
         """
+        query = self._history_query(asset, period, start, end, institution)
+        if query.url is None:
+            return query.cached
+
+        try:
+            response = self._client.get(query.url, headers=self._get_headers())
+            response.raise_for_status()
+            data = _json_loads(response.content)
+
+            # Parse response: {"timestamp": "open|high|low|close", ...}
+            df = self._parse_history(data)
+
+        except Exception as e:
+            raise APIError(f"Failed to fetch canlidoviz history for {asset}: {e}") from e
+
+        return self._merge_history(query, df)
+
+    async def aget_history(
+        self,
+        asset: str,
+        period: str = "1mo",
+        start: datetime | None = None,
+        end: datetime | None = None,
+        institution: str | None = None,
+    ) -> pd.DataFrame:
+        """
+        Async variant of get_history.
+
+        Args:
+            asset: Currency code (USD, EUR) or metal (gram-altin).
+            period: Period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y).
+            start: Start date. Overrides period if provided.
+            end: End date. Defaults to now.
+            institution: Optional bank slug for bank-specific history.
+
+        Returns:
+            DataFrame with OHLC data indexed by Date.
+
+        Raises:
+            DataNotAvailableError: If asset is not supported.
+            APIError: If API request fails.
+        """
+        frames = await self.aget_many_history([asset], period, start, end, institution)
+        return frames[asset]
+
+    async def aget_many_history(
+        self,
+        assets: list[str],
+        period: str = "1mo",
+        start: datetime | None = None,
+        end: datetime | None = None,
+        institution: str | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Fetch history for several assets concurrently.
+
+        Requests share one httpx.AsyncClient and at most
+        MAX_CONCURRENT_REQUESTS are in flight at a time. Assets whose window
+        is already cached are served without a request.
+
+        Args:
+            assets: Currency codes or metal slugs.
+            period: Period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y).
+            start: Start date. Overrides period if provided.
+            end: End date. Defaults to now.
+            institution: Optional bank slug for bank-specific history.
+
+        Returns:
+            Dictionary mapping each asset to its OHLC DataFrame.
+
+        Raises:
+            DataNotAvailableError: If an asset is not supported.
+            APIError: If an API request fails.
+        """
+        queries = {
+            asset: self._history_query(asset, period, start, end, institution)
+            for asset in assets
+        }
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        async def fetch(client: httpx.AsyncClient, asset: str) -> pd.DataFrame:
+            query = queries[asset]
+            if query.url is None:
+                return query.cached
+
+            try:
+                async with semaphore:
+                    response = await client.get(query.url, headers=self._get_headers())
+                response.raise_for_status()
+                df = self._parse_history(_json_loads(response.content))
+            except Exception as e:
+                raise APIError(
+                    f"Failed to fetch canlidoviz history for {asset}: {e}"
+                ) from e
+
+            return self._merge_history(query, df)
+
+        async with httpx.AsyncClient(
+            timeout=self._client.timeout,
+            headers=self.DEFAULT_HEADERS,
+            limits=httpx.Limits(max_connections=self.MAX_CONCURRENT_REQUESTS),
+        ) as client:
+            frames = await asyncio.gather(*(fetch(client, asset) for asset in queries))
+
+        return dict(zip(queries, frames))
+
+    def get_many_history(
+        self,
+        assets: list[str],
+        period: str = "1mo",
+        start: datetime | None = None,
+        end: datetime | None = None,
+        institution: str | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Blocking wrapper around aget_many_history.
+
+        Must not be called from a running event loop; await
+        aget_many_history there instead.
+
+        Args:
+            assets: Currency codes or metal slugs.
+            period: Period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y).
+            start: Start date. Overrides period if provided.
+            end: End date. Defaults to now.
+            institution: Optional bank slug for bank-specific history.
+
+        Returns:
+            Dictionary mapping each asset to its OHLC DataFrame.
+        """
+        return asyncio.run(
+            self.aget_many_history(assets, period, start, end, institution)
+        )
+
+    def _history_query(
+        self,
+        asset: str,
+        period: str,
+        start: datetime | None,
+        end: datetime | None,
+        institution: str | None,
+    ) -> "_HistoryQuery":
+        """
+        Resolve the window for a request against the daily history cache.
+
+        Daily bars are cached per (asset, institution) together with the
+        span fetched so far. A window inside that span is sliced from the
+        cache (ending on the span's last day counts, so polling within the
+        cache TTL makes no request, as before); one that only runs past its
+        end fetches just the tail, from the start of the last cached day
+        since that bar may have been partial; anything else fetches the
+        whole window.
+
+        Raises:
+            DataNotAvailableError: If asset is not supported.
+        """
         item_id = self._get_item_id(asset, institution)
         if item_id is None:
             if institution:
@@ -483,65 +685,84 @@ class CanlidovizProvider(BaseProvider):
         if start:
             start_dt = start
         else:
-            days = {
-                "1d": 1,
-                "5d": 5,
-                "1mo": 30,
-                "3mo": 90,
-                "6mo": 180,
-                "1y": 365,
-                "2y": 730,
-                "5y": 1825,
-                "max": 3650,
-            }.get(period, 30)
+            days = _PERIOD_DAYS.get(period, 30)
             start_dt = end_dt - timedelta(days=days)
 
-        cache_key = f"canlidoviz:history:{asset}:{institution}:{start_dt.date()}:{end_dt.date()}"
-        cached = self._cache_get(cache_key)
-        if cached is not None:
-            return cached
+        start_dt, end_dt = _naive(start_dt), _naive(end_dt)
+        cache_key = _daily_cache_key(asset, institution)
+        entry: _DailyHistory | None = self._cache_get(cache_key)
+        fetch_start = start_dt
+        if entry is not None and entry.first <= start_dt <= entry.last:
+            if end_dt.date() <= entry.last.date():
+                cached = _slice_history(entry.frame, start_dt, end_dt)
+                return _HistoryQuery(cache_key, start_dt, end_dt, None, fetch_start, cached)
+            fetch_start = datetime.combine(entry.last.date(), dt_time.min)
+
+        url = (
+            f"{self.API_BASE}/items/history?period=DAILY&itemDataId={item_id}"
+            f"&startDate={_api_timestamp(fetch_start)}&endDate={_api_timestamp(end_dt)}"
+        )
+        return _HistoryQuery(cache_key, start_dt, end_dt, url, fetch_start, None)
+
+    def _merge_history(self, query: "_HistoryQuery", fetched: pd.DataFrame) -> pd.DataFrame:
+        """Fold freshly fetched bars into the daily cache and return the window.
+
+        A whole-window fetch is returned exactly as the API sent it; only a
+        tail fetch merged onto cached bars is sliced back to the window.
+        """
+        first, last = query.fetch_start, query.end
+        frame = fetched
+
+        entry: _DailyHistory | None = self._cache_get(query.cache_key)
+        # Only extend the cached span when the two spans touch or overlap
+        if entry is not None and entry.first <= last and first <= entry.last:
+            frames = [f for f in (entry.frame, fetched) if not f.empty]
+            if len(frames) == 2:
+                frame = pd.concat(frames)
+                frame = frame[~frame.index.duplicated(keep="last")].sort_index()
+            elif frames:
+                frame = frames[0]
+            first, last = min(first, entry.first), max(last, entry.last)
+        elif entry is not None and entry.last > last:
+            # Disjoint older window: keep the more recent span for polling
+            return fetched
+
+        self._cache_set(
+            query.cache_key, _DailyHistory(frame, first, last), TTL.OHLCV_HISTORY
+        )
+        if query.fetch_start == query.start:
+            return fetched
+        return _slice_history(frame, query.start, query.end)
+
+    @staticmethod
+    def _parse_history(data: dict[str, str]) -> pd.DataFrame:
+        """
+        Parse history API payload into an OHLC DataFrame.
 
-        try:
-            url = f"{self.API_BASE}/items/history"
-            params = {
-                "period": "DAILY",
-                "itemDataId": item_id,
-                "startDate": start_dt.strftime("%Y-%m-%dT%H:%M:%S"),
-                "endDate": end_dt.strftime("%Y-%m-%dT%H:%M:%S"),
-            }
+        Rows with a bad timestamp or fewer than four numeric values are dropped.
 
-            response = self._client.get(url, headers=self._get_headers(), params=params)
-            response.raise_for_status()
-            data = response.json()
+        Args:
+            data: Mapping of epoch seconds to "open|high|low|close" strings.
 
-            # Parse response: {"timestamp": "open|high|low|close", ...}
-            records = []
-            for ts_str, ohlc_str in data.items():
-                try:
-                    ts = int(ts_str)
-                    dt = datetime.fromtimestamp(ts)
-                    values = ohlc_str.split("|")
-                    if len(values) >= 4:
-                        records.append({
-                            "Date": dt,
-                            "Open": float(values[0]),
-                            "High": float(values[1]),
-                            "Low": float(values[2]),
-                            "Close": float(values[3]),
-                        })
-                except (ValueError, IndexError):
-                    continue
+        Returns:
+            DataFrame with OHLC columns indexed by Date (local time), sorted.
+        """
+        if not data:
+            return pd.DataFrame()
 
-            df = pd.DataFrame(records)
-            if not df.empty:
-                df.set_index("Date", inplace=True)
-                df.sort_index(inplace=True)
+        raw = pd.Series(data, dtype=object)
+        dates = pd.to_datetime(pd.to_numeric(raw.index, errors="coerce"), unit="s", utc=True)
+        dates = dates.tz_convert(tzlocal()).tz_localize(None).as_unit("us")
 
-            self._cache_set(cache_key, df, TTL.OHLCV_HISTORY)
-            return df
+        values = raw.str.split("|", n=4, expand=True).reindex(columns=range(4))
+        ohlc = values.apply(pd.to_numeric, errors="coerce").astype(float)
+        ohlc.columns = ["Open", "High", "Low", "Close"]
+        ohlc.index = pd.Index(dates, name="Date")
 
-        except Exception as e:
-            raise APIError(f"Failed to fetch canlidoviz history for {asset}: {e}") from e
+        ohlc = ohlc[ohlc.index.notna()].dropna()
+        if ohlc.empty:
+            return pd.DataFrame()
+        return ohlc.sort_index()
 
     def get_current(self, asset: str, institution: str | None = None) -> dict[str, Any]:
         """
@@ -566,8 +787,15 @@ class CanlidovizProvider(BaseProvider):
             return cached
 
         try:
-            # Get recent history to extract latest price
-            df = self.get_history(asset, period="5d", institution=institution)
+            # Latest bar from the daily history cache if it already reaches
+            # today (any window warms it), else fetch recent history
+            entry: _DailyHistory | None = self._cache_get(
+                _daily_cache_key(asset, institution)
+            )
+            if entry is not None and entry.last.date() >= datetime.now().date():
+                df = entry.frame
+            else:
+                df = self.get_history(asset, period="5d", institution=institution)
 
             if df.empty:
                 raise DataNotAvailableError(f"No data for {asset}")
@@ -596,11 +824,11 @@ class CanlidovizProvider(BaseProvider):
 
     def get_supported_currencies(self) -> list[str]:
         """Get list of supported currencies."""
-        return sorted(self.CURRENCY_IDS.keys())
+        return list(_sorted_keys(type(self), "CURRENCY_IDS"))
 
     def get_supported_metals(self) -> list[str]:
         """Get list of supported metals."""
-        return sorted(self.METAL_IDS.keys())
+        return list(_sorted_keys(type(self), "METAL_IDS"))
 
     def get_supported_banks(self, currency: str = "USD") -> list[str]:
         """
@@ -612,30 +840,7 @@ class CanlidovizProvider(BaseProvider):
         Returns:
             List of bank slugs.
         """
-        currency = currency.upper()
-        if currency == "USD":
-            return sorted(self.BANK_USD_IDS.keys())
-        elif currency == "EUR":
-            return sorted(self.BANK_EUR_IDS.keys())
-        elif currency == "GBP":
-            return sorted(self.BANK_GBP_IDS.keys())
-        elif currency == "CHF":
-            return sorted(self.BANK_CHF_IDS.keys())
-        elif currency == "CAD":
-            return sorted(self.BANK_CAD_IDS.keys())
-        elif currency == "AUD":
-            return sorted(self.BANK_AUD_IDS.keys())
-        elif currency == "JPY":
-            return sorted(self.BANK_JPY_IDS.keys())
-        elif currency == "RUB":
-            return sorted(self.BANK_RUB_IDS.keys())
-        elif currency == "SAR":
-            return sorted(self.BANK_SAR_IDS.keys())
-        elif currency == "AED":
-            return sorted(self.BANK_AED_IDS.keys())
-        elif currency == "CNY":
-            return sorted(self.BANK_CNY_IDS.keys())
-        return []
+        return list(_sorted_bank_slugs(type(self), currency.upper()))
 
     def get_bank_rates(
         self, currency: str, bank: str | None = None
@@ -670,8 +875,10 @@ class CanlidovizProvider(BaseProvider):
             try:
                 response = self._client.get(url, headers=self._get_headers())
                 response.raise_for_status()
-                html = response.text
-                cached = self._parse_bank_rates_html(html, currency)
+                # Raw bytes: only the matched cells get decoded
+                cached = self._parse_bank_rates_html(
+                    response.content, currency, response.encoding or "utf-8"
+                )
                 self._cache_set(cache_key, cached, TTL.FX_RATES)
             except Exception as e:
                 raise APIError(f"Failed to fetch bank rates: {e}") from e
@@ -687,9 +894,9 @@ class CanlidovizProvider(BaseProvider):
         return pd.DataFrame(cached)
 
     def _parse_bank_rates_html(
-        self, html: str, currency: str
+        self, html: bytes | str, currency: str, encoding: str = "utf-8"
     ) -> list[dict[str, Any]]:
-        """Parse bank rates from HTML page.
+        """Parse bank rates from HTML page (raw bytes in ``encoding``, or str).
 
         HTML structure: Each bank is in a table row with TDs:
         - TD 0: Bank name link
@@ -699,48 +906,32 @@ class CanlidovizProvider(BaseProvider):
         - TD 4: High (Yüksek)
         - TD 5: Low (Düşük)
         """
-        soup = BeautifulSoup(html, "html.parser")
-        results = []
-
-        # Find all bank links in the "DİĞER PİYASALAR" table
-        # Pattern: /doviz-kurlari/{bank-slug}/{currency-slug}
         currency_slug = self.CURRENCY_SLUGS.get(currency.upper(), "")
-        pattern = re.compile(rf"/doviz-kurlari/([^/]+)/{currency_slug}$")
+        if isinstance(html, str):
+            html, encoding = html.encode("utf-8"), "utf-8"
 
-        for link in soup.find_all("a", href=pattern):
-            match = pattern.search(link.get("href", ""))
-            if not match:
-                continue
+        # Fast path: regex scan of the raw text. Falls back to a full lxml
+        # parse if it cannot match every bank link (e.g. the row markup changed).
+        rows = _scan_bank_rows(html, currency_slug, encoding)
+        if rows is None:
+            rows = _xpath_bank_rows(html, currency_slug, encoding)
 
-            bank_slug = match.group(1)
+        results = []
+        for bank_slug, bank_text, buy_text, sell_text in rows:
             # Skip the main currency page link
-            if bank_slug == currency_slug:
+            if not bank_slug or bank_slug == currency_slug:
                 continue
 
-            # Get bank display name from link text
-            bank_text = link.get_text(strip=True)
             # Remove timestamp if present (e.g., "AKBANK15:57:42" or "AKBANK 15:57:42")
-            bank_name = re.sub(r"\s*\d{2}:\d{2}:\d{2}$", "", bank_text)
-
-            # Find the parent TD element
-            td_parent = link.find_parent("td")
-            if not td_parent:
-                continue
-
-            # Get sibling TDs containing the values
-            sibling_tds = td_parent.find_next_siblings("td")
-            if len(sibling_tds) < 2:
-                continue
+            bank_name = _TIMESTAMP_RE.sub("", bank_text)
 
             try:
-                # TD 0: Buy price (clean number like "42.4400")
-                buy_text = sibling_tds[0].get_text(strip=True)
+                # TD 1: Buy price (clean number like "42.4400")
                 buy = float(buy_text.replace(",", "."))
 
-                # TD 1: Sell price + change concatenated (e.g., "43.79000.54%-1.21")
+                # TD 2: Sell price + change concatenated (e.g., "43.79000.54%-1.21")
                 # Extract the first decimal number (sell price)
-                sell_text = sibling_tds[1].get_text(strip=True)
-                sell_match = re.match(r"^(\d+[.,]\d+)", sell_text)
+                sell_match = _PRICE_RE.match(sell_text)
                 if not sell_match:
                     continue
                 sell = float(sell_match.group(1).replace(",", "."))
@@ -761,13 +952,188 @@ class CanlidovizProvider(BaseProvider):
         return results
 
 
+@lru_cache(maxsize=4096)
+def _lookup_item_id(
+    cls: type[CanlidovizProvider], asset: str, institution: str | None
+) -> int | None:
+    """CanlidovizProvider._get_item_id against ``cls``'s lookup tables."""
+    asset_upper = asset.upper()
+
+    if institution:
+        # Convert dovizcom slug to canlidoviz slug if needed
+        inst_slug = cls.DOVIZCOM_TO_CANLIDOVIZ.get(institution, institution)
+        item_id = cls._BANK_IDS.get((asset_upper, inst_slug))
+        if item_id is None:
+            item_id = cls._BANK_IDS.get((asset, inst_slug))
+        return item_id
+
+    item_id = cls._MAIN_IDS.get(asset_upper)
+    if item_id is None:
+        item_id = cls._MAIN_IDS.get(asset)
+    return item_id
+
+
+@lru_cache(maxsize=None)
+def _sorted_keys(cls: type[CanlidovizProvider], table: str) -> tuple[str, ...]:
+    """Sorted keys of one of ``cls``'s ID tables (tables are static)."""
+    return tuple(sorted(getattr(cls, table)))
+
+
+@lru_cache(maxsize=None)
+def _sorted_bank_slugs(cls: type[CanlidovizProvider], currency: str) -> tuple[str, ...]:
+    """Sorted bank slugs for an upper-case currency code; empty if unknown."""
+    return tuple(sorted(cls._BANK_ID_TABLES.get(currency, {})))
+
+
+class _DailyHistory(NamedTuple):
+    """Cached daily bars for one (asset, institution) and the span fetched."""
+
+    frame: pd.DataFrame
+    first: datetime
+    last: datetime
+
+
+class _HistoryQuery(NamedTuple):
+    """A resolved history request; url is None when the cache covers the window."""
+
+    cache_key: str
+    start: datetime
+    end: datetime
+    url: str | None
+    fetch_start: datetime
+    cached: pd.DataFrame | None
+
+
+def _daily_cache_key(asset: str, institution: str | None) -> str:
+    """Cache key of the daily history span for an (asset, institution)."""
+    return f"canlidoviz:daily:{asset}:{institution}"
+
+
+def _slice_history(frame: pd.DataFrame, start: datetime, end: datetime) -> pd.DataFrame:
+    """Rows of a daily frame on the days start..end, inclusive, as the API filters."""
+    if frame.empty:
+        return frame
+    first_day = datetime.combine(start.date(), dt_time.min)
+    after_last_day = datetime.combine(end.date() + timedelta(days=1), dt_time.min)
+    return frame[(frame.index >= first_day) & (frame.index < after_last_day)]
+
+
+def _naive(dt: datetime) -> datetime:
+    """Drop tzinfo; the API takes naive local timestamps."""
+    return dt.replace(tzinfo=None) if dt.tzinfo is not None else dt
+
+
+def _api_timestamp(dt: datetime) -> str:
+    """Format as the API expects: "YYYY-MM-DDTHH:MM:SS"."""
+    return dt.isoformat(timespec="seconds")
+
+
+def _json_loads(content: bytes) -> Any:
+    """Decode a JSON body with orjson when installed, else the stdlib."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _stripped_text(element: Any) -> str:
+    """Concatenate an element's text nodes, each stripped (like bs4 get_text(strip=True))."""
+    return "".join(text.strip() for text in element.itertext())
+
+
+def _stripped_fragment_text(fragment: str) -> str:
+    """_stripped_text for a raw HTML fragment: drop tags, unescape, strip pieces."""
+    return "".join(unescape(text).strip() for text in _TAG_RE.split(fragment))
+
+
+# Body of a single cell: anything up to, but never across, the closing </td>
+_CELL_BODY = rb"((?:(?!</td>).)*)"
+
+
+@lru_cache(maxsize=None)
+def _bank_link_re(currency_slug: str) -> re.Pattern[bytes]:
+    """Opening tag of a bank link for ``currency_slug``; group 1 is the bank slug."""
+    return re.compile(
+        rb'<a\b[^>]*href="[^"]*/doviz-kurlari/([^/"]+)/' + re.escape(currency_slug.encode()) + rb'"[^>]*>'
+    )
+
+
+@lru_cache(maxsize=None)
+def _bank_row_re(currency_slug: str) -> re.Pattern[bytes]:
+    """Row pattern: bank link TD followed by the buy and sell TDs.
+
+    Every group is tempered so it cannot run past its own ``</td>`` (or the
+    link's ``</a>``); markup after the link, such as a timestamp span, is
+    matched but discarded, like the link-text-only XPath path.
+    """
+    return re.compile(
+        _bank_link_re(currency_slug).pattern
+        + rb"((?:(?!</a>|</td>).)*)</a>(?:(?!</td>).)*</td>\s*"
+        + rb"<td[^>]*>" + _CELL_BODY + rb"</td>\s*"
+        + rb"<td[^>]*>" + _CELL_BODY + rb"</td>",
+        re.DOTALL,
+    )
+
+
+def _scan_bank_rows(
+    html: bytes, currency_slug: str, encoding: str
+) -> list[tuple[str, str, str, str]] | None:
+    """(bank slug, name, buy, sell) texts for each bank row, via regex.
+
+    Returns None when the scan does not account for every bank link on the
+    page (unexpected row markup), so the caller can fall back to XPath.
+    """
+    matches = _bank_row_re(currency_slug).findall(html)
+    if not matches or len(matches) != len(_bank_link_re(currency_slug).findall(html)):
+        return None
+    return [
+        tuple(
+            _stripped_fragment_text(cell.decode(encoding, "replace"))
+            for cell in match
+        )
+        for match in matches
+    ]
+
+
+def _xpath_bank_rows(
+    html: bytes, currency_slug: str, encoding: str
+) -> list[tuple[str, str, str, str]]:
+    """(bank slug, name, buy, sell) texts for each bank row, via a full lxml parse."""
+    tree = lxml.html.fromstring(html, parser=lxml.html.HTMLParser(encoding=encoding))
+    rows = []
+
+    # Find all bank links in the "DİĞER PİYASALAR" table
+    # Pattern: /doviz-kurlari/{bank-slug}/{currency-slug}
+    for link in _BANK_LINKS_XPATH(tree, suffix=f"/{currency_slug}"):
+        # href ends with /doviz-kurlari/{bank-slug}/{currency-slug}
+        parts = link.get("href", "").rsplit("/", 3)
+        if len(parts) < 4 or parts[-3] != "doviz-kurlari":
+            continue
+
+        # TD siblings following the link's TD contain the values
+        sibling_tds = _VALUE_TDS_XPATH(link)
+        if len(sibling_tds) < 2:
+            continue
+
+        rows.append((
+            parts[-2],
+            _stripped_text(link),
+            _stripped_text(sibling_tds[0]),
+            _stripped_text(sibling_tds[1]),
+        ))
+
+    return rows
+
+
 # Singleton
 _provider: CanlidovizProvider | None = None
+_provider_lock = threading.Lock()
 
 
 def get_canlidoviz_provider() -> CanlidovizProvider:
     """Get singleton provider instance."""
     global _provider
     if _provider is None:
-        _provider = CanlidovizProvider()
+        with _provider_lock:
+            if _provider is None:
+                _provider = CanlidovizProvider()
     return _provider
@@ -6,9 +6,12 @@ Fetches central bank policy rates from tcmb.gov.tr:
 - Late liquidity window (LON) rates
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from borsapy._providers.base import BaseProvider
 from borsapy.cache import TTL
@@ -20,6 +23,17 @@ TCMB_URLS = {
     "late_liquidity": "https://www.tcmb.gov.tr/wps/wcm/connect/TR/TCMB+TR/Main+Menu/Temel+Faaliyetler/Para+Politikasi/Merkez+Bankasi+Faiz+Oranlari/Gec+Likidite+Penceresi+%28LON%29",
 }
 
+# Table parsing, built once: whitespace-only text nodes and id indexing
+# are skipped since only cell text is read. lxml serializes concurrent
+# use of a shared parser, which is safe.
+_PARSER = lxml_html.HTMLParser(remove_blank_text=True, collect_ids=False)
+_ROWS_XPATH = etree.XPath("(//table)[1]//tr")
+_CELLS_XPATH = etree.XPath(".//td")
+
+# Shared by get_all_rates so its three page fetches do not start and join
+# fresh threads on every call
+_RATES_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="tcmb-rates")
+
 
 class TCMBRatesProvider(BaseProvider):
     """Provider for TCMB interest rates."""
@@ -32,11 +46,9 @@ class TCMBRatesProvider(BaseProvider):
             "36,50" -> 36.5
             "-" -> None
         """
-        text = text.strip()
-        if not text or text == "-":
-            return None
         try:
-            # Turkish format: comma is decimal separator
+            # Turkish format: comma is decimal separator. float() already
+            # ignores surrounding whitespace and rejects "" and "-".
             return float(text.replace(",", "."))
         except ValueError:
             return None
@@ -48,16 +60,28 @@ class TCMBRatesProvider(BaseProvider):
             "12.12.25" -> datetime(2025, 12, 12)
             "01.02.2024" -> datetime(2024, 2, 1)
         """
-        text = text.strip()
-        if not text:
+        # Split by hand rather than strptime: dates come in one per table row
+        parts = text.strip().split(".")
+        if len(parts) != 3:
+            return None
+
+        day, month, year = parts
+        if not (
+            0 < len(day) <= 2
+            and 0 < len(month) <= 2
+            and len(year) in (2, 4)
+            and (day + month + year).isascii()
+            and (day + month + year).isdigit()
+        ):
             return None
 
+        y = int(year)
+        if len(year) == 2:
+            # Same pivot as strptime's %y: 69-99 -> 19xx, 00-68 -> 20xx
+            y += 1900 if y >= 69 else 2000
+
         try:
-            # Try short format first (DD.MM.YY)
-            if len(text.split(".")[-1]) == 2:
-                return datetime.strptime(text, "%d.%m.%y")
-            # Try full format (DD.MM.YYYY)
-            return datetime.strptime(text, "%d.%m.%Y")
+            return datetime(y, int(month), int(day))
         except ValueError:
             return None
 
@@ -72,27 +96,28 @@ class TCMBRatesProvider(BaseProvider):
             return cached
 
         response = self._get(url)
-        html = response.text
-        soup = BeautifulSoup(html, "lxml")
-
-        # Find the main data table
-        table = soup.find("table")
-        if not table:
+        # Hand lxml the raw bytes; the cells read below are dates and
+        # numbers, so decoding to str first would only add work.
+        try:
+            root = lxml_html.fromstring(response.content, parser=_PARSER)
+        except etree.ParserError:
+            # Empty / whitespace-only body: no table, as with no <table>
             return []
 
-        rows = table.find_all("tr")
+        # Rows of the main (first) data table
+        rows = _ROWS_XPATH(root)
         if not rows:
             return []
 
         results = []
         for row in rows[1:]:  # Skip header row
-            cols = row.find_all("td")
+            cols = _CELLS_XPATH(row)
             if len(cols) < 3:
                 continue
 
-            date = self._parse_date(cols[0].text)
-            borrowing = self._parse_turkish_number(cols[1].text)
-            lending = self._parse_turkish_number(cols[2].text)
+            date = self._parse_date(cols[0].text_content())
+            borrowing = self._parse_turkish_number(cols[1].text_content())
+            lending = self._parse_turkish_number(cols[2].text_content())
 
             if date:
                 results.append({
@@ -171,9 +196,13 @@ class TCMBRatesProvider(BaseProvider):
         Returns:
             List of dicts with rate_type, borrowing, and lending.
         """
-        policy = self.get_policy_rate()
-        overnight = self.get_overnight_rates()
-        late_liquidity = self.get_late_liquidity_rates()
+        # Three independent pages: fetch them concurrently
+        policy_future = _RATES_POOL.submit(self.get_policy_rate)
+        overnight_future = _RATES_POOL.submit(self.get_overnight_rates)
+        late_liquidity_future = _RATES_POOL.submit(self.get_late_liquidity_rates)
+        policy = policy_future.result()
+        overnight = overnight_future.result()
+        late_liquidity = late_liquidity_future.result()
 
         return [
             {
@@ -214,11 +243,14 @@ class TCMBRatesProvider(BaseProvider):
 
 # Singleton instance
 _provider: TCMBRatesProvider | None = None
+_provider_lock = threading.Lock()
 
 
 def get_tcmb_rates_provider() -> TCMBRatesProvider:
     """Get the singleton TCMB rates provider instance."""
     global _provider
     if _provider is None:
-        _provider = TCMBRatesProvider()
+        with _provider_lock:
+            if _provider is None:
+                _provider = TCMBRatesProvider()
     return _provider
@@ -4,6 +4,7 @@ Fetches Turkish sovereign Eurobond data from Ziraat Bank's API.
 Includes USD and EUR denominated bonds with bid/ask prices and yields.
 """
 
+import threading
 from datetime import datetime, timedelta
 
 from bs4 import BeautifulSoup
@@ -185,22 +186,31 @@ class ZiraatEurobondProvider(BaseProvider):
             Eurobond dict or None if not found.
         """
         isin = isin.upper()
+
         bonds = self.get_eurobonds()
 
-        for bond in bonds:
-            if bond["isin"] == isin:
-                return bond
+        # ISIN index over the cached bond list, rebuilt whenever that list
+        # is refetched, so lookups for many ISINs skip the linear scan
+        cache_key = "ziraat_eurobonds:by_isin"
+        indexed = self._cache_get(cache_key)
+        if indexed is None or indexed[0] is not bonds:
+            # reversed: first bond wins on duplicate ISINs, as the scan did
+            indexed = (bonds, {bond["isin"]: bond for bond in reversed(bonds)})
+            self._cache_set(cache_key, indexed, TTL.FX_RATES)
 
-        return None
+        return indexed[1].get(isin)
 
 
 # Singleton instance
 _provider: ZiraatEurobondProvider | None = None
+_provider_lock = threading.Lock()
 
 
 def get_eurobond_provider() -> ZiraatEurobondProvider:
     """Get the singleton Eurobond provider instance."""
     global _provider
     if _provider is None:
-        _provider = ZiraatEurobondProvider()
+        with _provider_lock:
+            if _provider is None:
+                _provider = ZiraatEurobondProvider()
     return _provider
@@ -10,7 +10,11 @@ T = TypeVar("T")
 
 @dataclass
 class CacheEntry(Generic[T]):
-    """A single cache entry with value and expiration time."""
+    """A single cache entry with value and expiration time.
+
+    ``expires_at`` is on the time.monotonic() clock, so wall-clock
+    adjustments (NTP steps, manual changes) cannot extend or cut short a TTL.
+    """
 
     value: T
     expires_at: float
@@ -29,7 +33,7 @@ class Cache:
             entry = self._store.get(key)
             if entry is None:
                 return None
-            if time.time() > entry.expires_at:
+            if time.monotonic() > entry.expires_at:
                 del self._store[key]
                 return None
             return entry.value
@@ -37,7 +41,7 @@ class Cache:
     def set(self, key: str, value: Any, ttl_seconds: int) -> None:
         """Set a value in cache with TTL in seconds."""
         with self._lock:
-            self._store[key] = CacheEntry(value=value, expires_at=time.time() + ttl_seconds)
+            self._store[key] = CacheEntry(value=value, expires_at=time.monotonic() + ttl_seconds)
 
     def delete(self, key: str) -> bool:
         """Delete a key from cache. Returns True if key existed."""
@@ -55,7 +59,7 @@ class Cache:
     def cleanup(self) -> int:
         """Remove expired entries. Returns number of entries removed."""
         with self._lock:
-            now = time.time()
+            now = time.monotonic()
             expired_keys = [k for k, v in self._store.items() if now > v.expires_at]
             for key in expired_keys:
                 del self._store[key]
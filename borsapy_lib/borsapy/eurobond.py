@@ -28,6 +28,18 @@ import pandas as pd
 from borsapy._providers.ziraat_eurobond import get_eurobond_provider
 from borsapy.exceptions import DataNotAvailableError
 
+# Fields of each provider bond dict, in output column order
+_EUROBOND_COLUMNS = [
+    "isin",
+    "maturity",
+    "days_to_maturity",
+    "currency",
+    "bid_price",
+    "bid_yield",
+    "ask_price",
+    "ask_yield",
+]
+
 
 class Eurobond:
     """Single Turkish sovereign Eurobond interface.
@@ -154,19 +166,9 @@ def eurobonds(currency: str | None = None) -> pd.DataFrame:
     data = provider.get_eurobonds(currency=currency)
 
     if not data:
-        return pd.DataFrame(
-            columns=[
-                "isin",
-                "maturity",
-                "days_to_maturity",
-                "currency",
-                "bid_price",
-                "bid_yield",
-                "ask_price",
-                "ask_yield",
-            ]
-        )
-
-    df = pd.DataFrame(data)
-    df = df.sort_values("maturity")
+        return pd.DataFrame(columns=_EUROBOND_COLUMNS)
+
+    # Columnar build: one list per field instead of row-wise dict inference
+    df = pd.DataFrame({col: [bond.get(col) for bond in data] for col in _EUROBOND_COLUMNS})
+    df.sort_values("maturity", inplace=True, ignore_index=True)
     return df
@@ -241,9 +241,8 @@ class Screener:
 
         try:
             provider = get_bist_index_provider()
-            components = provider.get_components(index_code)
-            if components:
-                symbols = [c["symbol"] for c in components]
+            symbols = provider.get_component_symbols(index_code)
+            if symbols:
                 return df[df["symbol"].isin(symbols)].reset_index(drop=True)
         except Exception:
             pass  # If index lookup fails, return unfiltered
@@ -23,12 +23,33 @@ Examples:
     >>> bp.policy_rate()              # 38.0
 """
 
+import threading
+import time
+from collections.abc import Callable
 from datetime import datetime, timedelta
+from typing import Any
 
 import pandas as pd
 
 from borsapy._providers.tcmb_rates import get_tcmb_rates_provider
 
+# history() period filters
+_PERIOD_MAP = {
+    "1w": timedelta(days=7),
+    "1mo": timedelta(days=30),
+    "3mo": timedelta(days=90),
+    "6mo": timedelta(days=180),
+    "1y": timedelta(days=365),
+    "2y": timedelta(days=730),
+    "5y": timedelta(days=1825),
+    "10y": timedelta(days=3650),
+}
+
+# Property name -> (monotonic time, value), shared by all TCMB instances
+# since callers typically build a fresh TCMB() per lookup
+_memo_values: dict[str, tuple[float, Any]] = {}
+_memo_lock = threading.Lock()
+
 
 class TCMB:
     """TCMB interest rates interface.
@@ -51,10 +72,26 @@ class TCMB:
         {'borrowing': 36.5, 'lending': 41.0}
     """
 
+    # Seconds a property value is reused, across instances
+    _MEMO_TTL = 60
+
     def __init__(self):
         """Initialize TCMB interface."""
         self._provider = get_tcmb_rates_provider()
 
+    def _memo(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Return compute()'s value, reusing it for _MEMO_TTL seconds."""
+        now = time.monotonic()
+        with _memo_lock:
+            hit = _memo_values.get(key)
+        if hit is not None and now - hit[0] < self._MEMO_TTL:
+            return hit[1]
+        # Computed outside the lock so one slow fetch does not block the others
+        value = compute()
+        with _memo_lock:
+            _memo_values[key] = (now, value)
+        return value
+
     @property
     def policy_rate(self) -> float | None:
         """Get current 1-week repo rate (policy rate).
@@ -64,8 +101,7 @@ class TCMB:
         Returns:
             Policy rate as percentage (e.g., 38.0 for 38%).
         """
-        data = self._provider.get_policy_rate()
-        return data.get("lending")
+        return self._memo("policy_rate", lambda: self._provider.get_policy_rate().get("lending"))
 
     @property
     def overnight(self) -> dict:
@@ -80,7 +116,7 @@ class TCMB:
         Example:
             {'borrowing': 36.5, 'lending': 41.0}
         """
-        data = self._provider.get_overnight_rates()
+        data = self._memo("overnight", self._provider.get_overnight_rates)
         return {
             "borrowing": data.get("borrowing"),
             "lending": data.get("lending"),
@@ -99,7 +135,7 @@ class TCMB:
         Example:
             {'borrowing': 0.0, 'lending': 44.0}
         """
-        data = self._provider.get_late_liquidity_rates()
+        data = self._memo("late_liquidity", self._provider.get_late_liquidity_rates)
         return {
             "borrowing": data.get("borrowing"),
             "lending": data.get("lending"),
@@ -119,7 +155,7 @@ class TCMB:
             1     overnight       36.5     41.0
             2  late_liquidity      0.0     44.0
         """
-        data = self._provider.get_all_rates()
+        data = self._memo("rates", self._provider.get_all_rates)
         df = pd.DataFrame(data)
         if "rate_type" in df.columns:
             df = df.rename(columns={"rate_type": "type"})
@@ -153,27 +189,23 @@ class TCMB:
         if not data:
             return pd.DataFrame(columns=["date", "borrowing", "lending"])
 
-        df = pd.DataFrame(data)
-        df["date"] = pd.to_datetime(df["date"])
-        df = df.set_index("date").sort_index()
+        # Columnar build: dates are already datetimes, no per-row inference
+        index = pd.DatetimeIndex([row["date"] for row in data], name="date")
+        df = pd.DataFrame(
+            {
+                "borrowing": [row["borrowing"] for row in data],
+                "lending": [row["lending"] for row in data],
+            },
+            index=index,
+        ).sort_index()
 
         # Apply period filter if specified
         if period:
-            end_date = datetime.now()
-            period_map = {
-                "1w": timedelta(days=7),
-                "1mo": timedelta(days=30),
-                "3mo": timedelta(days=90),
-                "6mo": timedelta(days=180),
-                "1y": timedelta(days=365),
-                "2y": timedelta(days=730),
-                "5y": timedelta(days=1825),
-                "10y": timedelta(days=3650),
-            }
-
-            if period.lower() in period_map:
-                start_date = end_date - period_map[period.lower()]
-                df = df[df.index >= start_date]
+            span = _PERIOD_MAP.get(period.lower())
+            if span is not None:
+                start_date = datetime.now() - span
+                # Index is sorted: binary-searched slice instead of a mask
+                df = df.loc[pd.Timestamp(start_date):]
             # "max" or unknown period returns all data
 
         return df
@@ -502,37 +502,41 @@ def calculate_supertrend(
     basic_upper = hl2 + (multiplier * atr)
     basic_lower = hl2 - (multiplier * atr)
 
-    # Initialize arrays
+    # Initialize arrays; the recursive band logic below reads plain
+    # ndarrays, since per-element .iloc access dominates the loop otherwise
     n = len(df)
     supertrend = np.zeros(n)
     direction = np.zeros(n)
     final_upper = np.zeros(n)
     final_lower = np.zeros(n)
+    upper_values = basic_upper.to_numpy(dtype=float)
+    lower_values = basic_lower.to_numpy(dtype=float)
+    close_values = close.to_numpy(dtype=float)
 
     # First value
-    final_upper[0] = basic_upper.iloc[0]
-    final_lower[0] = basic_lower.iloc[0]
-    supertrend[0] = basic_upper.iloc[0]
+    final_upper[0] = upper_values[0]
+    final_lower[0] = lower_values[0]
+    supertrend[0] = upper_values[0]
     direction[0] = -1  # Start bearish
 
     # Calculate Supertrend
     for i in range(1, n):
         # Final Upper Band
-        if basic_upper.iloc[i] < final_upper[i - 1] or close.iloc[i - 1] > final_upper[i - 1]:
-            final_upper[i] = basic_upper.iloc[i]
+        if upper_values[i] < final_upper[i - 1] or close_values[i - 1] > final_upper[i - 1]:
+            final_upper[i] = upper_values[i]
         else:
             final_upper[i] = final_upper[i - 1]
 
         # Final Lower Band
-        if basic_lower.iloc[i] > final_lower[i - 1] or close.iloc[i - 1] < final_lower[i - 1]:
-            final_lower[i] = basic_lower.iloc[i]
+        if lower_values[i] > final_lower[i - 1] or close_values[i - 1] < final_lower[i - 1]:
+            final_lower[i] = lower_values[i]
         else:
             final_lower[i] = final_lower[i - 1]
 
         # Supertrend and Direction
         if supertrend[i - 1] == final_upper[i - 1]:
             # Was bearish
-            if close.iloc[i] > final_upper[i]:
+            if close_values[i] > final_upper[i]:
                 supertrend[i] = final_lower[i]
                 direction[i] = 1  # Bullish
             else:
@@ -540,7 +544,7 @@ def calculate_supertrend(
                 direction[i] = -1  # Bearish
         else:
             # Was bullish
-            if close.iloc[i] < final_lower[i]:
+            if close_values[i] < final_lower[i]:
                 supertrend[i] = final_upper[i]
                 direction[i] = -1  # Bearish
             else:
@@ -668,9 +672,14 @@ def calculate_wma(
     if col not in df.columns:
         return pd.Series(np.nan, index=df.index, name=f"WMA_{period}")
     weights = np.arange(1, period + 1, dtype=float)
-    return df[col].rolling(window=period, min_periods=period).apply(
-        lambda x: np.dot(x, weights) / weights.sum(), raw=True
-    )
+    # One matrix-vector product over strided windows instead of a Python
+    # callback per window through rolling().apply
+    values = df[col].to_numpy(dtype=float)
+    wma = np.full(len(values), np.nan)
+    if len(values) >= period:
+        windows = np.lib.stride_tricks.sliding_window_view(values, period)
+        wma[period - 1 :] = windows @ weights / weights.sum()
+    return pd.Series(wma, index=df.index, name=df[col].name)
 
 
 def calculate_dema(
@@ -34,6 +34,7 @@ ENDPOINTS = [
     ("Stock Depth", "/stocks/THYAO/depth"),
     ("Stock Disclosures", "/stocks/THYAO/disclosures?limit=3"),
     ("Stock Compare", "/stocks/compare?symbols=THYAO,ASELS"),
+    ("Stock Batch", "/stocks/batch?symbols=THYAO,ASELS"),
     ("Market Screener", "/market/screener?limit=3&offset=0"),
     ("Stock Dividends", "/stocks/THYAO/dividends"),
     ("Stock Financials", "/stocks/THYAO/financials?type=income"),
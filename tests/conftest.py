@@ -0,0 +1,9 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The API imports borsapy from the vendored copy, not site-packages
+for path in (ROOT, ROOT / "borsapy_lib"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
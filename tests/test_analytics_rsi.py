@@ -0,0 +1,30 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from api_core.services.analytics import last_rsi
+from borsapy.technical import calculate_rsi
+
+SERIES = {
+    "flat": [10.0] * 30,
+    "rising": list(range(1, 31)),
+    "falling": list(range(30, 0, -1)),
+    "exactly_one_period": list(range(14)),
+    "random_walk": (100 + np.random.default_rng(0).normal(0, 2, 250).cumsum()).tolist(),
+    "short": [1.0, 2.0, 3.0],
+}
+
+
+@pytest.mark.parametrize("name", SERIES)
+def test_last_rsi_matches_calculate_rsi(name):
+    close = np.asarray(SERIES[name], dtype=np.float64)
+
+    expected = calculate_rsi(pd.DataFrame({"Close": close})).iloc[-1]
+    actual = last_rsi(close)
+
+    if math.isnan(expected):
+        assert actual is None
+    else:
+        assert actual == pytest.approx(expected, abs=1e-9)
@@ -0,0 +1,166 @@
+import asyncio
+import os
+
+import httpx
+import pandas as pd
+import pytest
+
+from borsapy._providers import bist_index
+from borsapy._providers.bist_index import BistIndexProvider
+from borsapy.cache import get_cache
+
+CSV = (
+    "TARIH;ENDEKS KODU;ENDEKS ADI;BILESEN KODU;BULTEN_ADI;AGIRLIK\n"
+    "DATE;INDEX CODE;INDEX NAME;CONSTITUENT CODE;NAME;WEIGHT\n"
+    "20260101;XU030;BIST 30;AKBNK.E;AKBANK;1.5\n"
+    "20260101;XU030;BIST 30;THYAO.E;TÜRK HAVA YOLLARI;2.5\n"
+    "20260101;XU100;BIST 100;AKBNK.E;AKBANK;1.1\n"
+).encode()
+
+XU030 = [
+    {"symbol": "AKBNK", "name": "AKBANK"},
+    {"symbol": "THYAO", "name": "TÜRK HAVA YOLLARI"},
+]
+
+
+class FakeCSVServer:
+    def __init__(self):
+        self.validators = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.validators.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, content=CSV, headers={"ETag": '"v1"', "Content-Type": "text/csv; charset=utf-8"}
+        )
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(bist_index, "DISK_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(bist_index, "COMPONENTS_PARQUET_PATH", tmp_path / "components.parquet")
+    monkeypatch.setattr(bist_index, "COMPONENTS_META_PATH", tmp_path / "components.json")
+    get_cache().clear()
+    yield FakeCSVServer()
+    get_cache().clear()
+
+
+def _components(server: FakeCSVServer, symbol: str = "XU030"):
+    get_cache().clear()
+    provider = BistIndexProvider()
+    provider._client = httpx.Client(transport=httpx.MockTransport(server))
+    return provider.get_components(symbol)
+
+
+def _expire_disk_copy():
+    os.utime(bist_index.COMPONENTS_PARQUET_PATH, (1, 1))
+
+
+def test_download_writes_parquet_and_validators(server, tmp_path):
+    assert _components(server) == XU030
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["components.json", "components.parquet"]
+    assert server.validators == [None]
+
+
+def test_fresh_disk_copy_skips_the_request(server):
+    _components(server)
+
+    assert _components(server) == XU030
+    assert server.validators == [None]
+
+
+def test_stale_disk_copy_is_revalidated_with_etag(server):
+    _components(server)
+    _expire_disk_copy()
+
+    assert _components(server) == XU030
+    assert server.validators == [None, '"v1"']
+    # 304 restarts the freshness window
+    assert _components(server) == XU030
+    assert server.validators == [None, '"v1"']
+
+
+def test_failed_write_keeps_previous_copy(server, monkeypatch):
+    _components(server)
+    before = pd.read_parquet(bist_index.COMPONENTS_PARQUET_PATH)
+
+    def broken_to_parquet(self, path, **kwargs):
+        with open(path, "wb") as f:
+            f.write(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pd.DataFrame, "to_parquet", broken_to_parquet)
+    BistIndexProvider()._write_disk_cache(before.head(1), {"etag": '"v2"'})
+
+    pd.testing.assert_frame_equal(pd.read_parquet(bist_index.COMPONENTS_PARQUET_PATH), before)
+    assert sorted(p.name for p in bist_index.DISK_CACHE_DIR.iterdir()) == ["components.parquet"]
+    # Validators for an unknown copy are gone, so the next fetch is unconditional
+    assert BistIndexProvider()._read_disk_meta() == {}
+
+
+def _async_provider(server: FakeCSVServer, monkeypatch) -> BistIndexProvider:
+    monkeypatch.setattr(
+        bist_index.httpx, "AsyncHTTPTransport", lambda **kwargs: httpx.MockTransport(server)
+    )
+    return BistIndexProvider()
+
+
+def test_async_downloads_share_one_client_per_loop(server, monkeypatch):
+    provider = _async_provider(server, monkeypatch)
+
+    async def scenario():
+        results = await asyncio.gather(*(provider.aget_components("XU030") for _ in range(5)))
+        first = provider._loop_state()
+        # Force another download on the same loop
+        provider._loaded = False
+        get_cache().clear()
+        _expire_disk_copy()
+        await provider.aget_components("XU030")
+        second = provider._loop_state()
+        await provider.aclose()
+        return results, first, second
+
+    results, first, second = asyncio.run(scenario())
+
+    assert results == [XU030] * 5
+    assert first is second
+    assert server.validators == [None, '"v1"']
+
+
+def test_async_download_works_across_event_loops(server, monkeypatch):
+    provider = _async_provider(server, monkeypatch)
+
+    async def components(symbol):
+        try:
+            return await provider.aget_components(symbol)
+        finally:
+            await provider.aclose()
+
+    assert asyncio.run(components("XU030")) == XU030
+    provider._loaded = False
+    get_cache().clear()
+    _expire_disk_copy()
+
+    # A lock or client bound to the finished loop would fail here
+    assert asyncio.run(components("XU100")) == [{"symbol": "AKBNK", "name": "AKBANK"}]
+    assert server.validators == [None, '"v1"']
+
+
+def test_aclose_closes_the_loop_client(server, monkeypatch):
+    provider = _async_provider(server, monkeypatch)
+
+    async def scenario():
+        await provider.aget_components("XU030")
+        client = provider._loop_state().client
+        await provider.aclose()
+        reopened = provider._loop_state().client
+        await provider.aclose()
+        return client, reopened
+
+    client, reopened = asyncio.run(scenario())
+
+    assert client.is_closed
+    assert reopened is not client and reopened.is_closed
+    assert not provider._loop_states
@@ -0,0 +1,38 @@
+import time
+
+from api_core.services.cache import CacheNamespace
+
+
+def test_cached_none_is_served_without_refetch():
+    cache = CacheNamespace("test_none", maxsize=10, ttl_seconds=60)
+    calls = []
+
+    assert cache.get_or_set("KEY", lambda: calls.append(1)) is None
+    assert cache.get_or_set("KEY", lambda: calls.append(1)) is None
+    assert len(calls) == 1
+
+
+def test_entries_expire_after_ttl():
+    cache = CacheNamespace("test_ttl", maxsize=10, ttl_seconds=0.05)
+    cache.set("KEY", "value")
+
+    assert cache.get("KEY") == "value"
+    time.sleep(0.06)
+
+    assert cache.get("KEY") is None
+    assert cache.stats().size == 0
+
+
+def test_full_cache_sweeps_expired_then_evicts_soonest_to_expire():
+    cache = CacheNamespace("test_evict", maxsize=10, ttl_seconds=60)
+    for n in range(10):
+        cache.set(f"K{n}", n)
+
+    cache.set("NEW", "new")
+
+    stats = cache.stats()
+    assert stats.size == 10
+    assert stats.evictions == 1
+    assert cache.get("K0") is None
+    assert cache.get("K1") == 1
+    assert cache.get("NEW") == "new"
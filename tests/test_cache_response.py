@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+from itertools import count
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from api_core.services.cache import CacheNamespace, cache_response
+from api_core.services.response import api_ok, pagination_meta
+
+_paths = count()
+
+
+@pytest.fixture
+def app():
+    return FastAPI()
+
+
+def _route(app: FastAPI, handler, namespace: str = "market") -> str:
+    # Response caches are process-wide, so every test gets its own URL
+    path = f"/cached-{next(_paths)}"
+    app.get(path)(cache_response(namespace)(handler))
+    return path
+
+
+def test_hit_skips_endpoint_and_replays_headers(app):
+    calls = []
+
+    def handler(request: Request, response: Response):
+        calls.append(1)
+        response.headers["X-Count"] = str(len(calls))
+        return {"calls": len(calls)}
+
+    path = _route(app, handler)
+    client = TestClient(app)
+
+    first = client.get(path)
+    second = client.get(path)
+
+    assert len(calls) == 1
+    assert first.json() == second.json() == {"calls": 1}
+    assert second.headers["X-Count"] == "1"
+
+
+def test_query_string_is_part_of_the_key(app):
+    calls = []
+
+    def handler(request: Request, response: Response, q: str = ""):
+        calls.append(q)
+        return {"q": q}
+
+    path = _route(app, handler)
+    client = TestClient(app)
+
+    assert client.get(path, params={"q": "a"}).json() == {"q": "a"}
+    assert client.get(path, params={"q": "b"}).json() == {"q": "b"}
+    assert client.get(path, params={"q": "a"}).json() == {"q": "a"}
+    assert calls == ["a", "b"]
+
+
+def test_concurrent_misses_for_one_url_run_once(app):
+    calls = []
+    entered = threading.Event()
+    release = threading.Event()
+
+    def slow(request: Request, response: Response, q: str = ""):
+        calls.append(q)
+        entered.set()
+        release.wait(5)
+        return {"q": q}
+
+    path = _route(app, slow)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            same = [asyncio.create_task(client.get(f"{path}?q=same")) for _ in range(5)]
+            await asyncio.to_thread(entered.wait, 5)
+            release.set()
+            other = await client.get(f"{path}?q=other")
+            return await asyncio.gather(*same), other
+
+    same, other = asyncio.run(scenario())
+
+    assert [r.json() for r in same] == [{"q": "same"}] * 5
+    assert other.json() == {"q": "other"}
+    assert sorted(calls) == ["other", "same"]
+
+
+def test_envelope_responses_are_not_cached(app):
+    calls = []
+
+    def handler(request: Request, response: Response, envelope: bool = False):
+        calls.append(1)
+        rows = [1, 2]
+        meta = pagination_meta(limit=2, offset=0, count=len(rows))
+        return api_ok(rows, meta) if envelope else rows
+
+    path = _route(app, handler)
+    client = TestClient(app)
+
+    first = client.get(path, params={"envelope": "true"}).json()
+    time.sleep(0.01)
+    second = client.get(path, params={"envelope": "true"}).json()
+
+    assert len(calls) == 2
+    assert first["data"] == second["data"] == [1, 2]
+    assert first["meta"]["generated_at"] != second["meta"]["generated_at"]
+
+
+def test_response_expires_with_its_payload(app):
+    payloads = CacheNamespace("test_payload", maxsize=10, ttl_seconds=0.2)
+    fetches = []
+
+    def handler(request: Request, response: Response):
+        return payloads.get_or_set("KEY", lambda: fetches.append(1) or len(fetches))
+
+    # The response namespace TTL (static: a day) is far longer than the payload's
+    path = _route(app, handler, namespace="static")
+    client = TestClient(app)
+
+    assert client.get(path).json() == 1
+    assert client.get(path).json() == 1
+    time.sleep(0.25)
+
+    assert client.get(path).json() == 2
@@ -0,0 +1,80 @@
+from pathlib import Path
+
+from borsapy._providers import canlidoviz
+from borsapy._providers.canlidoviz import CanlidovizProvider
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+ROW = (
+    '<tr><td><a href="/doviz-kurlari/{slug}/dolar">{name}</a>'
+    "<small>15:57:42</small><span>new</span></td>"
+    "<td>{buy}</td><td>{sell}<span>0.54%</span></td><td>-1.21</td></tr>"
+)
+
+
+def _page(*rows: str) -> bytes:
+    return ("<html><body><table>" + "".join(rows) + "</table></body></html>").encode()
+
+
+def test_regex_keeps_groups_inside_their_cells():
+    html = _page(
+        ROW.format(slug="akbank", name="AKBANK", buy="42.4400", sell="43.7900"),
+        ROW.format(slug="garanti", name="GARANTI", buy="42.3900", sell="43.8200"),
+    )
+
+    assert canlidoviz._scan_bank_rows(html, "dolar", "utf-8") == [
+        ("akbank", "AKBANK", "42.4400", "43.79000.54%"),
+        ("garanti", "GARANTI", "42.3900", "43.82000.54%"),
+    ]
+
+
+def test_regex_and_xpath_agree_on_page_snapshot():
+    html = (FIXTURES / "canlidoviz_dolar.html").read_bytes()
+
+    scanned = canlidoviz._scan_bank_rows(html, "dolar", "utf-8")
+
+    assert scanned is not None
+    assert scanned == canlidoviz._xpath_bank_rows(html, "dolar", "utf-8")
+    assert [row[0] for row in scanned] == [
+        "akbank", "garanti-bbva", "is-bankasi", "ziraat-bankasi", "kapalicarsi",
+    ]
+
+
+def test_scan_defers_to_xpath_on_unmatched_links():
+    # Header cells instead of TDs: the link is found but no row pattern matches
+    html = _page(
+        ROW.format(slug="akbank", name="AKBANK", buy="42.4400", sell="43.7900"),
+        '<tr><td><a href="/doviz-kurlari/garanti/dolar">GARANTI</a></td>'
+        "<th>42.3900</th><th>43.8200</th></tr>",
+    )
+
+    assert canlidoviz._scan_bank_rows(html, "dolar", "utf-8") is None
+
+
+def test_parse_falls_back_to_xpath(monkeypatch):
+    # A stray bank link outside the rates table makes the scan incomplete
+    html = (FIXTURES / "canlidoviz_dolar.html").read_bytes().replace(
+        b"</main>", b'</main><a href="/doviz-kurlari/akbank/dolar">Akbank Dolar</a>'
+    )
+    calls = []
+    xpath_bank_rows = canlidoviz._xpath_bank_rows
+    monkeypatch.setattr(
+        canlidoviz, "_xpath_bank_rows",
+        lambda *args: calls.append(args) or xpath_bank_rows(*args),
+    )
+    provider = CanlidovizProvider.__new__(CanlidovizProvider)
+
+    rates = provider._parse_bank_rates_html(html, "USD")
+
+    assert len(calls) == 1
+    assert [rate["bank"] for rate in rates] == [
+        "akbank", "garanti-bbva", "is-bankasi", "ziraat-bankasi",
+    ]
+    assert rates[0] == {
+        "bank": "akbank",
+        "bank_name": "AKBANK",
+        "currency": "USD",
+        "buy": 42.44,
+        "sell": 43.79,
+        "spread": 3.18,
+    }
@@ -0,0 +1,82 @@
+import json
+from datetime import datetime, timedelta
+
+import httpx
+import pandas as pd
+import pytest
+
+from borsapy._providers.canlidoviz import CanlidovizProvider
+from borsapy.cache import get_cache
+
+END = datetime(2026, 6, 30, 15)
+
+
+class FakeHistoryAPI:
+    """Daily bars stamped at local midnight, filtered by whole days like the API."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        start = datetime.fromisoformat(request.url.params["startDate"]).date()
+        end = datetime.fromisoformat(request.url.params["endDate"]).date()
+        self.calls.append((start, end))
+        bars = {}
+        day = datetime(2026, 1, 1)
+        while day.date() <= end:
+            if day.date() >= start:
+                n = day.timetuple().tm_yday
+                bars[str(int(day.timestamp()))] = f"{n}|{n + 1}|{n - 1}|{n + 0.5}"
+            day += timedelta(days=1)
+        return httpx.Response(200, content=json.dumps(bars).encode())
+
+
+@pytest.fixture
+def api():
+    get_cache().clear()
+    yield FakeHistoryAPI()
+    get_cache().clear()
+
+
+def _provider(api: FakeHistoryAPI) -> CanlidovizProvider:
+    provider = CanlidovizProvider()
+    provider._client = httpx.Client(transport=httpx.MockTransport(api))
+    return provider
+
+
+def _uncached(api: FakeHistoryAPI, **kwargs) -> pd.DataFrame:
+    get_cache().clear()
+    try:
+        return _provider(api).get_history("USD", **kwargs)
+    finally:
+        get_cache().clear()
+
+
+def test_fetched_window_is_returned_unsliced(api):
+    frame = _provider(api).get_history("USD", period="1mo", end=END)
+
+    # 30 days back, both ends inclusive
+    assert len(frame) == 31
+    assert frame.index.min() == datetime(2026, 5, 31)
+    assert frame.index.max() == datetime(2026, 6, 30)
+
+
+def test_window_sliced_from_cache_matches_uncached(api):
+    provider = _provider(api)
+    provider.get_history("USD", period="3mo", end=END)
+
+    cached = provider.get_history("USD", period="1mo", end=END)
+
+    assert len(api.calls) == 1
+    pd.testing.assert_frame_equal(cached, _uncached(api, period="1mo", end=END))
+
+
+def test_tail_fetch_merged_onto_cache_matches_uncached(api):
+    provider = _provider(api)
+    provider.get_history("USD", period="1mo", end=END)
+
+    later = END + timedelta(days=3)
+    merged = provider.get_history("USD", period="1mo", end=later)
+
+    assert api.calls[-1][0] == END.date()
+    pd.testing.assert_frame_equal(merged, _uncached(api, period="1mo", end=later))
@@ -0,0 +1,27 @@
+from borsapy._providers.canlidoviz import CanlidovizProvider
+
+
+class _CustomIds(CanlidovizProvider):
+    CURRENCY_IDS = {**CanlidovizProvider.CURRENCY_IDS, "USD": -1, "XYZ": -2}
+    _BANK_ID_TABLES = {"USD": {"test-bank": -3}}
+
+
+def test_subclass_tables_are_used():
+    assert _CustomIds._get_item_id("usd") == -1
+    assert _CustomIds._get_item_id("XYZ") == -2
+    assert _CustomIds._get_item_id("USD", "test-bank") == -3
+    assert _CustomIds._get_item_id("USD", "akbank") is None
+
+
+def test_base_tables_are_unaffected_by_subclass():
+    assert CanlidovizProvider._get_item_id("USD") == CanlidovizProvider.CURRENCY_IDS["USD"]
+    assert CanlidovizProvider._get_item_id("XYZ") is None
+    assert CanlidovizProvider._get_item_id("USD", "test-bank") is None
+
+
+def test_supported_lists_follow_subclass_tables():
+    provider = _CustomIds.__new__(_CustomIds)
+
+    assert "XYZ" in provider.get_supported_currencies()
+    assert provider.get_supported_banks("usd") == ["test-bank"]
+    assert "XYZ" not in CanlidovizProvider.__new__(CanlidovizProvider).get_supported_currencies()
@@ -0,0 +1,42 @@
+import sys
+import types
+
+import pandas as pd
+
+from api_core.routes import market
+
+
+def _fake_screener(monkeypatch, df: pd.DataFrame) -> None:
+    class Query:
+        def set_markets(self, *_):
+            return self
+
+        def select(self, *_):
+            return self
+
+        def get_scanner_data(self):
+            return len(df), df
+
+    monkeypatch.setitem(sys.modules, "tradingview_screener", types.SimpleNamespace(Query=Query))
+
+
+def test_heatmap_rows(monkeypatch):
+    _fake_screener(monkeypatch, pd.DataFrame({
+        "name": ["THYAO", "GARAN"],
+        "change": [1.234, -0.5],
+        "volume": [100, 2.5],
+        "sector": ["Transport", "Banks"],
+    }))
+
+    assert market._market_heatmap_payload() == [
+        {"symbol": "THYAO", "change": 1.23, "volume": 100.0, "sector": "Transport"},
+        {"symbol": "GARAN", "change": -0.5, "volume": 2.5, "sector": "Banks"},
+    ]
+
+
+def test_heatmap_defaults_missing_columns(monkeypatch):
+    _fake_screener(monkeypatch, pd.DataFrame({"name": ["THYAO"], "change": [2.0]}))
+
+    assert market._market_heatmap_payload() == [
+        {"symbol": "THYAO", "change": 2.0, "volume": 0.0, "sector": "N/A"},
+    ]
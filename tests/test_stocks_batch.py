@@ -0,0 +1,59 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from api_core.app import create_app
+from api_core.routes import stocks
+
+
+@pytest.fixture
+def requested(monkeypatch):
+    calls = []
+
+    def fake_payload(symbol):
+        calls.append(symbol)
+        if symbol == "FAIL":
+            raise RuntimeError("upstream down")
+        return {"symbol": symbol, "data": {"last": 1.0}}
+
+    monkeypatch.setattr(stocks, "_stock_payload", fake_payload)
+    return calls
+
+
+@pytest.fixture
+def client():
+    # Not entered as a context manager, so startup warm-ups do not run
+    return TestClient(create_app())
+
+
+def test_batch_dedupes_and_keeps_request_order(client, requested):
+    body = client.get("/stocks/batch", params={"symbols": "thyao, GARAN,THYAO,,garan"}).json()
+
+    assert list(body) == ["THYAO", "GARAN"]
+    assert sorted(requested) == ["GARAN", "THYAO"]
+
+
+def test_batch_is_capped_at_fifty_symbols(client, requested):
+    symbols = [f"S{n:03d}" for n in range(60)]
+
+    body = client.get("/stocks/batch", params={"symbols": ",".join(symbols)}).json()
+
+    assert list(body) == symbols[:50]
+    assert len(requested) == 50
+
+
+def test_batch_reports_failures_per_symbol(client, requested):
+    body = client.get("/stocks/batch", params={"symbols": "AKBNK,FAIL"}).json()
+
+    assert body == {
+        "AKBNK": {"symbol": "AKBNK", "data": {"last": 1.0}},
+        "FAIL": {"error": "upstream down"},
+    }
+
+
+def test_batch_route_is_not_shadowed_by_symbol_route(client, requested):
+    batch = client.get("/stocks/batch", params={"symbols": "ASELS"})
+    single = client.get("/stocks/batch2")
+
+    assert batch.json() == {"ASELS": {"symbol": "ASELS", "data": {"last": 1.0}}}
+    assert single.json() == {"symbol": "BATCH2", "data": {"last": 1.0}}
+    assert requested == ["ASELS", "BATCH2"]
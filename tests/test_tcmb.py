@@ -0,0 +1,26 @@
+from borsapy import tcmb
+from borsapy.tcmb import TCMB
+
+
+def test_policy_rate_is_shared_across_instances(monkeypatch):
+    monkeypatch.setattr(tcmb, "_memo_values", {})
+    calls = []
+    provider = tcmb.get_tcmb_rates_provider()
+    monkeypatch.setattr(provider, "get_policy_rate", lambda: calls.append(1) or {"lending": 38.0})
+
+    assert TCMB().policy_rate == 38.0
+    assert TCMB().policy_rate == 38.0
+    assert tcmb.policy_rate() == 38.0
+    assert len(calls) == 1
+
+
+def test_memo_expires(monkeypatch):
+    monkeypatch.setattr(tcmb, "_memo_values", {})
+    monkeypatch.setattr(TCMB, "_MEMO_TTL", 0)
+    calls = []
+    provider = tcmb.get_tcmb_rates_provider()
+    monkeypatch.setattr(provider, "get_policy_rate", lambda: calls.append(1) or {"lending": 38.0})
+
+    TCMB().policy_rate
+    TCMB().policy_rate
+    assert len(calls) == 2
@@ -0,0 +1,66 @@
+import threading
+
+import httpx
+import pytest
+
+from borsapy._providers.tcmb_rates import TCMB_URLS, TCMBRatesProvider
+from borsapy.cache import get_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    get_cache().clear()
+    yield
+    get_cache().clear()
+
+
+def _provider(handler) -> TCMBRatesProvider:
+    provider = TCMBRatesProvider()
+    provider._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return provider
+
+
+@pytest.mark.parametrize("body", [b"", b"  \r\n\t "])
+def test_empty_body_yields_no_rows(body):
+    provider = _provider(lambda request: httpx.Response(200, content=body))
+
+    assert provider.get_rate_history("policy") == []
+    assert provider.get_policy_rate() == {"date": None, "lending": None}
+    assert [rate["lending"] for rate in provider.get_all_rates()] == [None, None, None]
+
+
+def _page(rate: str) -> bytes:
+    return (
+        "<html><body><table><tr><th>Tarih</th><th>Borç Alma</th><th>Borç Verme</th></tr>"
+        f"<tr><td>12.12.25</td><td>{rate}</td><td>{rate}</td></tr></table></body></html>"
+    ).encode()
+
+
+def test_all_rates_fetches_pages_concurrently():
+    # Each request waits for the other two: a serial fetch times out here
+    barrier = threading.Barrier(3, timeout=5)
+    rates = {TCMB_URLS["policy"]: "38,00", TCMB_URLS["overnight"]: "36,50", TCMB_URLS["late_liquidity"]: "44,00"}
+
+    def handler(request):
+        barrier.wait()
+        return httpx.Response(200, content=_page(rates[str(request.url)]))
+
+    provider = _provider(handler)
+
+    assert [(rate["rate_type"], rate["lending"]) for rate in provider.get_all_rates()] == [
+        ("policy", 38.0),
+        ("overnight", 36.5),
+        ("late_liquidity", 44.0),
+    ]
+
+
+def test_all_rates_raises_a_getter_failure():
+    def handler(request):
+        if str(request.url) == TCMB_URLS["overnight"]:
+            return httpx.Response(503)
+        return httpx.Response(200, content=_page("38,00"))
+
+    provider = _provider(handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        provider.get_all_rates()